@@ -165,7 +165,7 @@ class SimpleRenderer:
         Units = Circles
         Buildings = Rectangles
         """
-        from simple.live.entities import Unit, Building
+        from simple.shared.kinds import EntityKind, entity_kind
 
         for entity in world.entities.values():
             if not entity.alive:
@@ -179,12 +179,13 @@ class SimpleRenderer:
             # Check if selected
             is_selected = selected_ids and entity.id in selected_ids
 
-            if isinstance(entity, Unit):
+            kind = entity_kind(entity)
+
+            if kind in (EntityKind.WORKER, EntityKind.SOLDIER):
                 radius = int(self.tile_size * 0.3)
 
                 # Soldiers are triangles, Workers are circles
-                is_soldier = hasattr(entity, 'damage')  # Soldiers have damage attribute
-                if is_soldier:
+                if kind == EntityKind.SOLDIER:
                     # Draw triangle pointing right
                     points = [
                         (sx + radius, sy),           # Right point
@@ -207,11 +208,10 @@ class SimpleRenderer:
                             (sx, sy), radius + 3, 2
                         )
 
-            elif isinstance(entity, Building):
+            elif kind in (EntityKind.BASE, EntityKind.BARRACKS):
                 # Buildings are rectangles
                 # Base is square, Barracks is wider rectangle
-                is_barracks = hasattr(entity, 'produces') and entity.produces == "Soldier"
-                if is_barracks:
+                if kind == EntityKind.BARRACKS:
                     # Barracks: wider rectangle
                     width = int(self.tile_size * 2.0)
                     height = int(self.tile_size * 1.2)
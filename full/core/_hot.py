@@ -0,0 +1,148 @@
+"""
+MicroCraft Full Hot Loops
+
+Numeric kernels for the full systems, compiled with Numba if it is
+installed. Without Numba the systems keep their plain Python code, which
+is faster than running these loops interpreted.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _heap_push(heap_f, heap_c, heap_n, size, f, c, node):
+    """Push (f, c, node) onto the binary heap, return the new heap arrays and size"""
+    if size == len(heap_f):
+        # Full: double the capacity
+        heap_f = np.concatenate((heap_f, np.empty_like(heap_f)))
+        heap_c = np.concatenate((heap_c, np.empty_like(heap_c)))
+        heap_n = np.concatenate((heap_n, np.empty_like(heap_n)))
+
+    # Sift up
+    i = size
+    while i > 0:
+        parent = (i - 1) // 2
+        pf = heap_f[parent]
+        if pf < f or (pf == f and heap_c[parent] < c):
+            break
+        heap_f[i] = pf
+        heap_c[i] = heap_c[parent]
+        heap_n[i] = heap_n[parent]
+        i = parent
+    heap_f[i] = f
+    heap_c[i] = c
+    heap_n[i] = node
+    return heap_f, heap_c, heap_n, size + 1
+
+
+def _heap_pop(heap_f, heap_c, heap_n, size):
+    """Remove the smallest entry, return its node and the new size"""
+    top = heap_n[0]
+    size -= 1
+    f = heap_f[size]
+    c = heap_c[size]
+    node = heap_n[size]
+
+    # Sift the last entry down from the root
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        right = child + 1
+        if right < size and (heap_f[right] < heap_f[child] or
+                             (heap_f[right] == heap_f[child] and heap_c[right] < heap_c[child])):
+            child = right
+        if f < heap_f[child] or (f == heap_f[child] and c < heap_c[child]):
+            break
+        heap_f[i] = heap_f[child]
+        heap_c[i] = heap_c[child]
+        heap_n[i] = heap_n[child]
+        i = child
+    heap_f[i] = f
+    heap_c[i] = c
+    heap_n[i] = node
+    return top, size
+
+
+def _find_path_loop(tiles, sx, sy, gx, gy, dir_x, dir_y, dir_cost, h_cache):
+    """A* over a tile grid (0 = walkable), same search as PathFinder.find_path().
+
+    Nodes are flat indices y * width + x. The open set is a binary heap
+    ordered by (f, push counter), like the heapq version, so both find
+    the same path. h_cache (one float per tile, all -1.0 on entry) holds
+    the heuristic of every tile seen so far, since tiles are often
+    relaxed more than once. Returns the path without the start as an
+    (n, 2) array of (x, y), empty if there is none.
+    """
+    height, width = tiles.shape
+    g_score = np.full(width * height, np.inf)
+    came_from = np.full(width * height, -1, dtype=np.int32)
+
+    heap_f = np.empty(64, dtype=np.float64)
+    heap_c = np.empty(64, dtype=np.int64)
+    heap_n = np.empty(64, dtype=np.int32)
+
+    start = sy * width + sx
+    goal = gy * width + gx
+    g_score[start] = 0.0
+    heap_f, heap_c, heap_n, size = _heap_push(heap_f, heap_c, heap_n, 0, 0.0, 0, start)
+    counter = 0  # Tie-breaker for heap
+
+    while size > 0:
+        current, size = _heap_pop(heap_f, heap_c, heap_n, size)
+
+        if current == goal:
+            # Reconstruct path (goal back to start, then reversed)
+            length = 0
+            node = current
+            while node != start:
+                length += 1
+                node = came_from[node]
+            path = np.empty((length, 2), dtype=np.int32)
+            node = current
+            for i in range(length - 1, -1, -1):
+                path[i, 0] = node % width
+                path[i, 1] = node // width
+                node = came_from[node]
+            return path
+
+        cx = current % width
+        cy = current // width
+        for d in range(len(dir_x)):
+            nx = cx + dir_x[d]
+            ny = cy + dir_y[d]
+            if nx < 0 or nx >= width or ny < 0 or ny >= height or tiles[ny, nx] != 0:
+                continue
+
+            neighbor = ny * width + nx
+            tentative_g = g_score[current] + dir_cost[d]
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+
+                # Octile heuristic, computed once per tile
+                h = h_cache[neighbor]
+                if h < 0.0:
+                    hx = abs(nx - gx)
+                    hy = abs(ny - gy)
+                    h = max(hx, hy) + 0.414 * min(hx, hy)
+                    h_cache[neighbor] = h
+
+                counter += 1
+                heap_f, heap_c, heap_n, size = _heap_push(
+                    heap_f, heap_c, heap_n, size, tentative_g + h, counter, neighbor)
+
+    # No path found
+    return np.empty((0, 2), dtype=np.int32)
+
+
+if njit is not None:
+    _heap_push = njit(cache=True)(_heap_push)
+    _heap_pop = njit(cache=True)(_heap_pop)
+    find_path_kernel = njit(cache=True)(_find_path_loop)
+else:
+    find_path_kernel = None  # Interpreted, PathFinder's heapq search is faster
@@ -121,6 +121,7 @@ class ParticleSystem:
         self.explosion_flashes: List[ExplosionFlash] = []
         self.hit_flash_entities: dict = {}  # entity_id -> remaining_time
         self.max_particles = max_particles
+        self._rng = random.Random()  # Own generator, not the shared module state
 
     def update(self, dt: float) -> None:
         """Update all effects."""
@@ -216,13 +217,32 @@ class ParticleSystem:
         max_size: float = 5
     ) -> None:
         """Spawn a burst of particles in all directions."""
+        # Same as calling spawn() count times, without the per-particle
+        # method call and capacity check
+        count = min(count, self.max_particles - len(self.particles))
+        if count <= 0:
+            return
+
+        uniform = self._rng.uniform
+        choice = self._rng.choice
+        palette = tuple(colors)
+        radians, cos, sin = math.radians, math.cos, math.sin
+        append = self.particles.append
+
         for _ in range(count):
-            angle = random.uniform(0, 360)
-            speed = random.uniform(min_speed, max_speed)
-            color = random.choice(colors)
-            lifetime = random.uniform(min_lifetime, max_lifetime)
-            size = random.uniform(min_size, max_size)
-            self.spawn(x, y, angle, speed, color, lifetime, size)
+            rad = radians(uniform(0, 360))
+            speed = uniform(min_speed, max_speed)
+            lifetime = uniform(min_lifetime, max_lifetime)
+            append(Particle(
+                x=x,
+                y=y,
+                vx=cos(rad) * speed,
+                vy=sin(rad) * speed,
+                color=choice(palette),
+                lifetime=lifetime,
+                max_lifetime=lifetime,
+                size=uniform(min_size, max_size)
+            ))
 
     def spawn_laser_beam(
         self,
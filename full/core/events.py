@@ -8,8 +8,9 @@ from typing import Callable, Dict, List, Any
 
 
 # === Event Dataclasses ===
+# Slotted: events are created on every hit, harvest and spawn
 
-@dataclass
+@dataclass(slots=True)
 class SpawnEvent:
     """Fired when a new entity is created."""
     kind: str
@@ -18,7 +19,7 @@ class SpawnEvent:
     pos: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class DeathEvent:
     """Fired when an entity dies."""
     entity_id: int
@@ -28,7 +29,7 @@ class DeathEvent:
     killer_id: int = None  # Who killed this entity
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceCollectedEvent:
     """Fired when a worker delivers minerals to base."""
     worker_id: int
@@ -37,14 +38,14 @@ class ResourceCollectedEvent:
     team_total: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GatheringStartedEvent:
     """Fired when a worker starts mining minerals."""
     worker_id: int
     team: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionStartedEvent:
     """Fired when a building starts producing a unit."""
     building_id: int
@@ -53,7 +54,7 @@ class ProductionStartedEvent:
     queue_position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionCompletedEvent:
     """Fired when a building completes a unit."""
     building_id: int
@@ -63,7 +64,7 @@ class ProductionCompletedEvent:
     pos: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingPlacedEvent:
     """Fired when a worker places a new building."""
     building_id: int
@@ -73,14 +74,14 @@ class BuildingPlacedEvent:
     builder_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandEvent:
     """Fired when player issues a command to a unit."""
     entity_id: int
     team: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackEvent:
     """Fired when a unit attacks another."""
     attacker_id: int
@@ -89,7 +90,7 @@ class AttackEvent:
     target_hp_remaining: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VisibilityChangedEvent:
     """Fired when fog of war reveals/hides entities."""
     entity_id: int
@@ -97,7 +98,7 @@ class VisibilityChangedEvent:
     now_visible: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemySpottedEvent:
     """Fired when a soldier spots an enemy entity."""
     soldier_id: int
@@ -107,7 +108,7 @@ class EnemySpottedEvent:
     is_base: bool  # True if enemy base was spotted
 
 
-@dataclass
+@dataclass(slots=True)
 class ReinforcementRequestedEvent:
     """Fired when a soldier requests backup at a location."""
     soldier_id: int
@@ -115,7 +116,7 @@ class ReinforcementRequestedEvent:
     target_pos: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class MineDepletedEvent:
     """Fired when a worker's mine becomes depleted."""
     worker_id: int
@@ -123,7 +124,7 @@ class MineDepletedEvent:
     mine_pos: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseUnderAttackEvent:
     """Fired when a team's base is being attacked."""
     base_id: int
@@ -131,7 +132,7 @@ class BaseUnderAttackEvent:
     attacker_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AIDecisionEvent:
     """Fired when the AI makes a decision (for logging)."""
     team: int
@@ -140,7 +141,7 @@ class AIDecisionEvent:
     details: dict = None  # Optional additional data
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingConstructionStartEvent:
     """Fired when a worker starts building construction."""
     worker_id: int
@@ -149,7 +150,7 @@ class BuildingConstructionStartEvent:
     pos: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingConstructionProgressEvent:
     """Fired to update building construction progress."""
     worker_id: int
@@ -159,7 +160,7 @@ class BuildingConstructionProgressEvent:
     progress: float  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InsufficientMineralsEvent:
     """Fired when trying to queue production without enough minerals."""
     team: int
@@ -169,7 +170,7 @@ class InsufficientMineralsEvent:
     available: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerWaitingForMineralsEvent:
     """Fired when worker is waiting for minerals to build."""
     worker_id: int
@@ -178,7 +179,7 @@ class WorkerWaitingForMineralsEvent:
     cost: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitReadyEvent:
     """Fired when a new unit announces itself."""
     unit_id: int
@@ -190,6 +191,9 @@ class UnitReadyEvent:
 
 # === EventBus ===
 
+_NO_HANDLERS = ()
+
+
 class EventBus:
     """Central event dispatcher - the heart of IoC pattern."""
 
@@ -212,13 +216,20 @@ class EventBus:
             except ValueError:
                 pass
 
+    def has_subscribers(self, event_type: type) -> bool:
+        """Check whether publishing an event type would reach anyone.
+
+        Lets hot loops skip building events that nobody would receive.
+        While recording, every event counts as heard.
+        """
+        return self._recording or bool(self._subscribers.get(event_type))
+
     def publish(self, event: Any) -> None:
         """Notify all handlers subscribed to this event's type."""
         if self._recording:
             self._event_history.append(event)
 
-        event_type = type(event)
-        for handler in self._subscribers.get(event_type, []):
+        for handler in self._subscribers.get(type(event), _NO_HANDLERS):
             handler(event)
 
     def clear(self) -> None:
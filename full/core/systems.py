@@ -12,6 +12,8 @@ import math
 import random
 from typing import List, Optional, Tuple, Dict, Set
 
+import numpy as np
+
 from .entities import Entity, Unit, Worker, Soldier, Building, Base, Barracks, UNIT_STATS, BUILDING_STATS
 from .events import (
     event_bus,
@@ -32,6 +34,7 @@ from .events import (
     GatheringStartedEvent,
 )
 from .effects import WORKER_NAMES, SOLDIER_RANKS
+from ._hot import find_path_kernel
 
 
 class PathFinder:
@@ -52,6 +55,14 @@ class PathFinder:
     def __init__(self, game_map):
         self.game_map = game_map
 
+        # DIRECTIONS as arrays for the compiled search
+        self._dir_x = np.array([d[0][0] for d in self.DIRECTIONS], dtype=np.int32)
+        self._dir_y = np.array([d[0][1] for d in self.DIRECTIONS], dtype=np.int32)
+        self._dir_cost = np.array([d[1] for d in self.DIRECTIONS], dtype=np.float64)
+
+        # Heuristic per tile for the compiled search, reset for every path
+        self._h_cache = np.full(game_map.width * game_map.height, -1.0) if game_map else None
+
     def find_path(self, start: Tuple[float, float], goal: Tuple[float, float]) -> List[Tuple[int, int]]:
         """Find optimal path from start to goal using A*."""
         if not self.game_map:
@@ -69,10 +80,22 @@ class PathFinder:
             if goal is None:
                 return []
 
-        # A* algorithm
+        # Compiled search (Numba), needs the start on the map
+        on_map = 0 <= start[0] < self.game_map.width and 0 <= start[1] < self.game_map.height
+        if find_path_kernel is not None and on_map:
+            self._h_cache.fill(-1.0)
+            path = find_path_kernel(self.game_map.tile_array(), start[0], start[1], goal[0], goal[1],
+                                    self._dir_x, self._dir_y, self._dir_cost, self._h_cache)
+            return [(int(x), int(y)) for x, y in path]
+
+        return self._search(start, goal)
+
+    def _search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """A* from start to goal tile (plain Python version)."""
         open_set: List[Tuple[float, int, Tuple[int, int]]] = [(0, 0, start)]
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
         g_score: Dict[Tuple[int, int], float] = {start: 0}
+        h_cache: Dict[Tuple[int, int], float] = {}  # Tiles are often relaxed more than once
         counter = 0  # Tie-breaker for heap
 
         while open_set:
@@ -92,7 +115,10 @@ class PathFinder:
                 if neighbor not in g_score or tentative_g < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score = tentative_g + self._heuristic(neighbor, goal)
+                    h = h_cache.get(neighbor)
+                    if h is None:
+                        h = h_cache[neighbor] = self._heuristic(neighbor, goal)
+                    f_score = tentative_g + h
                     counter += 1
                     heapq.heappush(open_set, (f_score, counter, neighbor))
 
@@ -100,7 +126,7 @@ class PathFinder:
         return []
 
     def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
-        """Diagonal distance heuristic."""
+        """Octile distance heuristic (diagonal steps cost 1.414)."""
         dx = abs(a[0] - b[0])
         dy = abs(a[1] - b[1])
         return max(dx, dy) + 0.414 * min(dx, dy)
@@ -214,6 +240,9 @@ class MovementSystem:
                         # No valid path, clear destination
                         entity.destination = None
 
+        # Later queries this tick must see the new positions
+        self.world.mark_moved()
+
     def _update_stuck_detection(self, entity: Unit, dt: float) -> None:
         """Check if unit is stuck and unstick if needed."""
         # Only check units that have a destination or path
@@ -290,8 +319,11 @@ class CombatSystem:
         """Process combat for all soldiers."""
         dead_entities = []
 
-        for entity in list(self.world.entities.values()):
-            if not isinstance(entity, Soldier) or not entity.alive:
+        # Attacks are the most frequent event, only build them if heard
+        publish_attacks = event_bus.has_subscribers(AttackEvent)
+
+        for entity in self.world.get_entities_by_type(Soldier):
+            if not entity.alive:  # Killed earlier this tick
                 continue
 
             # Reduce cooldown
@@ -325,12 +357,13 @@ class CombatSystem:
                         target.take_damage(entity.damage)
                         entity.cooldown_remaining = entity.attack_cooldown
 
-                        event_bus.publish(AttackEvent(
-                            attacker_id=entity.id,
-                            target_id=target.id,
-                            damage=entity.damage,
-                            target_hp_remaining=target.hp
-                        ))
+                        if publish_attacks:
+                            event_bus.publish(AttackEvent(
+                                attacker_id=entity.id,
+                                target_id=target.id,
+                                damage=entity.damage,
+                                target_hp_remaining=target.hp
+                            ))
 
                         # Check if attacking a base - fire alert event
                         if isinstance(target, Base):
@@ -375,10 +408,7 @@ class ResourceSystem:
 
     def update(self, dt: float) -> None:
         """Process worker gathering behavior."""
-        for entity in list(self.world.entities.values()):
-            if not isinstance(entity, Worker) or not entity.alive:
-                continue
-
+        for entity in self.world.get_entities_by_type(Worker):
             self._process_worker(entity, dt)
 
     def _process_worker(self, worker: Worker, dt: float) -> None:
@@ -420,10 +450,11 @@ class ResourceSystem:
                 worker.state = "gathering"
                 worker.destination = None
                 self._gather_timers[worker.id] = 0.0
-                event_bus.publish(GatheringStartedEvent(
-                    worker_id=worker.id,
-                    team=worker.team
-                ))
+                if event_bus.has_subscribers(GatheringStartedEvent):
+                    event_bus.publish(GatheringStartedEvent(
+                        worker_id=worker.id,
+                        team=worker.team
+                    ))
 
         elif worker.state == "gathering":
             if worker.gather_target is None or worker.gather_target.depleted:
@@ -457,12 +488,13 @@ class ResourceSystem:
                 # Deliver minerals
                 self.world.team_minerals[worker.team] += worker.carrying
 
-                event_bus.publish(ResourceCollectedEvent(
-                    worker_id=worker.id,
-                    team=worker.team,
-                    amount=worker.carrying,
-                    team_total=self.world.team_minerals[worker.team]
-                ))
+                if event_bus.has_subscribers(ResourceCollectedEvent):
+                    event_bus.publish(ResourceCollectedEvent(
+                        worker_id=worker.id,
+                        team=worker.team,
+                        amount=worker.carrying,
+                        team_total=self.world.team_minerals[worker.team]
+                    ))
 
                 worker.carrying = 0
                 # Check if gather target is still valid
@@ -485,6 +517,10 @@ class ResourceSystem:
 class ProductionSystem:
     """Handles building production with queues."""
 
+    # Tick time (seconds) below this is float noise: a unit this close to
+    # done is done, and a leftover this small does not start the next one
+    EPSILON = 1e-9
+
     def __init__(self, world):
         self.world = world
         self._waiting_for_minerals: Dict[int, float] = {}  # building_id -> cooldown for event
@@ -497,90 +533,96 @@ class ProductionSystem:
             if self._waiting_for_minerals[bid] <= 0:
                 del self._waiting_for_minerals[bid]
 
-        for entity in list(self.world.entities.values()):
-            if not isinstance(entity, Building) or not entity.alive:
-                continue
-
+        for entity in self.world.get_buildings():
             if not entity.production_queue:
                 entity.waiting_for_minerals = False
                 continue
 
-            unit_type = entity.current_production
-            build_time = entity.build_time
-            cost = UNIT_STATS[unit_type]["cost"]
-
-            # Check if we can afford (only check when starting)
-            if entity.production_progress == 0:
-                if self.world.team_minerals[entity.team] < cost:
-                    entity.waiting_for_minerals = True
-                    continue
-                entity.waiting_for_minerals = False
-                self.world.team_minerals[entity.team] -= cost
-
-                event_bus.publish(ProductionStartedEvent(
-                    building_id=entity.id,
-                    unit_type=unit_type,
-                    team=entity.team,
-                    queue_position=len(entity.production_queue)
-                ))
-            else:
-                entity.waiting_for_minerals = False
-
-            # Progress production
-            entity.production_progress += dt / build_time
-
-            if entity.production_progress >= 1.0:
-                # Complete production
-                completed_type = entity.complete_production()
-
-                # Spawn unit near building
-                spawn_x = entity.x + random.uniform(-1, 1)
-                spawn_y = entity.y + 2
-
-                new_unit = self.world.spawn_entity(
-                    completed_type,
-                    entity.team,
-                    (spawn_x, spawn_y)
-                )
-
-                event_bus.publish(ProductionCompletedEvent(
-                    building_id=entity.id,
-                    unit_type=completed_type,
-                    unit_id=new_unit.id,
-                    team=entity.team,
-                    pos=new_unit.pos
-                ))
+            # A long tick can finish several queued units
+            time_left = dt
+            while entity.production_queue and time_left > self.EPSILON:
+                unit_type = entity.current_production
+                build_time = entity.build_time
+                cost = UNIT_STATS[unit_type]["cost"]
+
+                # Check if we can afford (only check when starting)
+                if entity.production_progress == 0:
+                    if self.world.team_minerals[entity.team] < cost:
+                        entity.waiting_for_minerals = True
+                        break
+                    entity.waiting_for_minerals = False
+                    self.world.team_minerals[entity.team] -= cost
 
-                # Fire UnitReadyEvent with name/rank
-                unit_name = random.choice(WORKER_NAMES)
-                if completed_type == "Worker":
-                    event_bus.publish(UnitReadyEvent(
-                        unit_id=new_unit.id,
-                        unit_type="Worker",
-                        team=entity.team,
-                        name=unit_name
-                    ))
-                elif completed_type == "Soldier":
-                    unit_rank = random.choice(SOLDIER_RANKS)
-                    event_bus.publish(UnitReadyEvent(
-                        unit_id=new_unit.id,
-                        unit_type="Soldier",
+                    event_bus.publish(ProductionStartedEvent(
+                        building_id=entity.id,
+                        unit_type=unit_type,
                         team=entity.team,
-                        name=unit_name,
-                        rank=unit_rank
+                        queue_position=len(entity.production_queue)
                     ))
+                else:
+                    entity.waiting_for_minerals = False
+
+                # Progress production
+                entity.production_progress += time_left / build_time
+                if entity.production_progress < 1.0 - self.EPSILON / build_time:
+                    break
+
+                # Time not needed for this unit goes to the next one
+                time_left = (entity.production_progress - 1.0) * build_time
+                self._complete_production(entity)
+
+    def _complete_production(self, entity: Building) -> None:
+        """Spawn the finished unit of a building's queue."""
+        completed_type = entity.complete_production()
+
+        # Spawn unit near building
+        spawn_x = entity.x + random.uniform(-1, 1)
+        spawn_y = entity.y + 2
+
+        new_unit = self.world.spawn_entity(
+            completed_type,
+            entity.team,
+            (spawn_x, spawn_y)
+        )
+
+        event_bus.publish(ProductionCompletedEvent(
+            building_id=entity.id,
+            unit_type=completed_type,
+            unit_id=new_unit.id,
+            team=entity.team,
+            pos=new_unit.pos
+        ))
 
-                # Set rally point if exists
-                if entity.rally_point:
-                    new_unit.destination = entity.rally_point
+        # Fire UnitReadyEvent with name/rank
+        unit_name = random.choice(WORKER_NAMES)
+        if completed_type == "Worker":
+            event_bus.publish(UnitReadyEvent(
+                unit_id=new_unit.id,
+                unit_type="Worker",
+                team=entity.team,
+                name=unit_name
+            ))
+        elif completed_type == "Soldier":
+            unit_rank = random.choice(SOLDIER_RANKS)
+            event_bus.publish(UnitReadyEvent(
+                unit_id=new_unit.id,
+                unit_type="Soldier",
+                team=entity.team,
+                name=unit_name,
+                rank=unit_rank
+            ))
+
+        # Set rally point if exists
+        if entity.rally_point:
+            new_unit.destination = entity.rally_point
 
-                # Auto-assign workers to gather minerals
-                if isinstance(new_unit, Worker):
-                    mineral = self.world.get_nearest_mineral(new_unit.x, new_unit.y)
-                    if mineral:
-                        new_unit.gather_target = mineral
-                        new_unit.state = "moving_to_mineral"
-                        new_unit.destination = mineral.pos
+        # Auto-assign workers to gather minerals
+        if isinstance(new_unit, Worker):
+            mineral = self.world.get_nearest_mineral(new_unit.x, new_unit.y)
+            if mineral:
+                new_unit.gather_target = mineral
+                new_unit.state = "moving_to_mineral"
+                new_unit.destination = mineral.pos
 
 
 class BuildingPlacementSystem:
@@ -599,10 +641,7 @@ class BuildingPlacementSystem:
             if self._mineral_warning_cooldown[wid] <= 0:
                 del self._mineral_warning_cooldown[wid]
 
-        for entity in list(self.world.entities.values()):
-            if not isinstance(entity, Worker) or not entity.alive:
-                continue
-
+        for entity in self.world.get_entities_by_type(Worker):
             if entity.build_target is None:
                 entity.waiting_for_minerals = False
                 continue
@@ -8,10 +8,14 @@ Features:
 """
 import json
 import csv
+import functools
+import math
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .entities import Entity, Unit, Building, Worker, Soldier, Base, Barracks, create_entity
 from .events import event_bus, SpawnEvent
 
@@ -36,6 +40,13 @@ class MineralPatch:
         return self.minerals <= 0
 
 
+@functools.lru_cache(maxsize=None)
+def _vision_disc(radius: int) -> np.ndarray:
+    """Boolean (2r+1, 2r+1) mask of the tiles within radius of the center."""
+    dy, dx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    return dx * dx + dy * dy <= radius * radius
+
+
 class FogOfWar:
     """Manages visibility state for a single team."""
 
@@ -47,19 +58,18 @@ class FogOfWar:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        # Grid stores visibility state for each tile
-        self.grid = [[self.HIDDEN for _ in range(width)] for _ in range(height)]
+        # Grid stores visibility state for each tile, indexed [y, x]
+        self.grid = np.full((height, width), self.HIDDEN, dtype=np.uint8)
 
     def update_visibility(self, entities: List[Entity]) -> Set[Tuple[int, int]]:
         """Update visibility based on entity vision ranges.
 
         Returns set of newly revealed tiles.
         """
+        grid = self.grid
+
         # First, demote all VISIBLE to EXPLORED
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] == self.VISIBLE:
-                    self.grid[y][x] = self.EXPLORED
+        np.minimum(grid, self.EXPLORED, out=grid)
 
         newly_visible = set()
 
@@ -71,29 +81,33 @@ class FogOfWar:
             vision = getattr(entity, 'vision', 5)
             cx, cy = int(entity.x), int(entity.y)
 
-            # Simple circular vision
-            for dy in range(-vision, vision + 1):
-                for dx in range(-vision, vision + 1):
-                    if dx * dx + dy * dy <= vision * vision:
-                        nx, ny = cx + dx, cy + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.grid[ny][nx] != self.VISIBLE:
-                                if self.grid[ny][nx] == self.HIDDEN:
-                                    newly_visible.add((nx, ny))
-                                self.grid[ny][nx] = self.VISIBLE
+            # Simple circular vision: stamp the disc, clipped to the map
+            x0, x1 = max(cx - vision, 0), min(cx + vision + 1, self.width)
+            y0, y1 = max(cy - vision, 0), min(cy + vision + 1, self.height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            disc = _vision_disc(vision)[y0 - cy + vision:y1 - cy + vision,
+                                        x0 - cx + vision:x1 - cx + vision]
+            window = grid[y0:y1, x0:x1]
+
+            revealed = disc & (window == self.HIDDEN)
+            if revealed.any():
+                ys, xs = np.nonzero(revealed)
+                newly_visible.update(zip((xs + x0).tolist(), (ys + y0).tolist()))
+            window[disc] = self.VISIBLE
 
         return newly_visible
 
     def is_visible(self, x: int, y: int) -> bool:
         """Check if a tile is currently visible."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[int(y)][int(x)] == self.VISIBLE
+            return bool(self.grid[int(y), int(x)] == self.VISIBLE)
         return False
 
     def is_explored(self, x: int, y: int) -> bool:
         """Check if a tile has been explored (seen at least once)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[int(y)][int(x)] >= self.EXPLORED
+            return bool(self.grid[int(y), int(x)] >= self.EXPLORED)
         return False
 
 
@@ -102,13 +116,31 @@ class GameMap:
     """The terrain map."""
     width: int
     height: int
-    tiles: List[List[int]]  # 0 = grass, 1 = rock (unwalkable)
+    tiles: np.ndarray  # (height, width) int8, 0 = grass, 1 = rock (unwalkable)
     mineral_positions: List[Tuple[float, float]] = field(default_factory=list)
+    # Row-major walkable flags for is_walkable(), indexing bytes beats a NumPy scalar lookup
+    _walkable: bytes = field(default=b"", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.tiles = np.ascontiguousarray(self.tiles, dtype=np.int8).reshape(self.height, self.width)
+        self._walkable = (self.tiles == 0).tobytes()
+
+    def __eq__(self, other):
+        # The generated __eq__ would compare the tile arrays elementwise
+        if not isinstance(other, GameMap):
+            return NotImplemented
+        return (self.width == other.width and self.height == other.height
+                and self.mineral_positions == other.mineral_positions
+                and np.array_equal(self.tiles, other.tiles))
+
+    def tile_array(self) -> np.ndarray:
+        """Get the tiles as a contiguous (height, width) int8 array."""
+        return self.tiles
 
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a tile can be walked on."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[int(y)][int(x)] == 0
+            return self._walkable[int(y) * self.width + int(x)] == 1
         return False
 
     def is_buildable(self, x: int, y: int, size: int = 2) -> bool:
@@ -123,8 +155,14 @@ class GameMap:
 class World:
     """Game world state container."""
 
+    GRID_CELL_SIZE = 4.0  # Tiles per spatial grid cell (see _nearby_entities)
+
     def __init__(self):
         self.entities: Dict[int, Entity] = {}
+        # Indexes over entities (id -> entity, in the same order)
+        self.by_type: Dict[type, Dict[int, Entity]] = {}
+        self.by_team: Dict[int, Dict[int, Entity]] = {}
+        self._buildings: Dict[int, Building] = {}
         self.minerals: Dict[int, MineralPatch] = {}
         self.next_id = 1
         self.game_map: Optional[GameMap] = None
@@ -141,6 +179,10 @@ class World:
         self.winner = None
         self.game_time = 0.0
 
+        # Spatial grid: cell -> living entities, rebuilt once per tick
+        self._grid: Dict[Tuple[int, int], List[Entity]] = {}
+        self._grid_time: Optional[float] = None
+
     def get_minerals(self, team: int) -> int:
         """Get mineral count for team."""
         return self.team_minerals.get(team, 0)
@@ -231,7 +273,12 @@ class World:
         """Create and register a new entity."""
         entity = create_entity(kind, self.next_id, team, pos)
         self.entities[entity.id] = entity
+        self.by_type.setdefault(type(entity), {})[entity.id] = entity
+        self.by_team.setdefault(team, {})[entity.id] = entity
+        if isinstance(entity, Building):
+            self._buildings[entity.id] = entity
         self.next_id += 1
+        self._grid_time = None  # Rebuild the spatial grid on next query
 
         event_bus.publish(SpawnEvent(
             kind=kind,
@@ -245,37 +292,68 @@ class World:
     def remove_entity(self, entity_id: int) -> None:
         """Remove an entity from the world."""
         if entity_id in self.entities:
-            del self.entities[entity_id]
+            entity = self.entities.pop(entity_id)
+            del self.by_type[type(entity)][entity_id]
+            del self.by_team[entity.team][entity_id]
+            self._buildings.pop(entity_id, None)
+            self._grid_time = None
+
+    def force_kill(self, entity_id: int) -> None:
+        """Set an entity's HP to zero and mark it dead, e.g. to set up a test.
+
+        Unlike a lethal hit this fires no events and leaves the entity in the
+        world, like any other dead entity until it is removed.
+        """
+        entity = self.entities.get(entity_id)
+        if entity:
+            entity.hp = 0
+            entity.alive = False
 
     def get_entity(self, entity_id: int) -> Optional[Entity]:
         """Get entity by ID."""
         return self.entities.get(entity_id)
 
-    def get_base(self, team: int) -> Optional[Base]:
-        """Get a team's base."""
-        for entity in self.entities.values():
-            if isinstance(entity, Base) and entity.team == team and entity.alive:
+    def iter_type(self, entity_type: type) -> Iterator[Entity]:
+        """Iterate over living entities of a type (subclasses included), in id order.
+
+        Don't spawn or remove entities while iterating.
+        """
+        groups = [group for cls, group in self.by_type.items() if issubclass(cls, entity_type)]
+        if len(groups) == 1:
+            entities = groups[0].values()
+        else:
+            entities = sorted((e for group in groups for e in group.values()), key=lambda e: e.id)
+        return (e for e in entities if e.alive)
+
+    def first_of(self, entity_type: type, team: int = None) -> Optional[Entity]:
+        """Get the oldest living entity of a type, optionally of one team."""
+        for entity in self.iter_type(entity_type):
+            if team is None or entity.team == team:
                 return entity
         return None
 
+    def get_base(self, team: int) -> Optional[Base]:
+        """Get a team's base."""
+        return self.first_of(Base, team)
+
     def get_entities_by_team(self, team: int) -> List[Entity]:
         """Get all entities belonging to a team."""
-        return [e for e in self.entities.values() if e.team == team and e.alive]
+        return [e for e in self.by_team.get(team, {}).values() if e.alive]
 
     def get_entities_by_type(self, entity_type: type) -> List[Entity]:
         """Get all entities of a specific type."""
-        return [e for e in self.entities.values() if isinstance(e, entity_type) and e.alive]
+        return list(self.iter_type(entity_type))
 
     def get_units(self, team: int = None) -> List[Unit]:
         """Get all units, optionally filtered by team."""
-        units = [e for e in self.entities.values() if isinstance(e, Unit) and e.alive]
+        units = list(self.iter_type(Unit))
         if team is not None:
             units = [u for u in units if u.team == team]
         return units
 
     def get_buildings(self, team: int = None) -> List[Building]:
         """Get all buildings, optionally filtered by team."""
-        buildings = [e for e in self.entities.values() if isinstance(e, Building) and e.alive]
+        buildings = [b for b in self._buildings.values() if b.alive]
         if team is not None:
             buildings = [b for b in buildings if b.team == team]
         return buildings
@@ -297,9 +375,47 @@ class World:
 
         return nearest
 
+    def mark_moved(self) -> None:
+        """Note that entities moved, so spatial queries rebuild their grid.
+
+        MovementSystem calls this every update. Code that moves entities
+        elsewhere (e.g. tests) must call it before the next query in the
+        same tick.
+        """
+        self._grid_time = None
+
+    def _nearby_entities(self, x: float, y: float, radius: float) -> List[Entity]:
+        """Get candidates for a query around (x, y), oldest (lowest id) first.
+
+        Looks only at the spatial grid cells overlapping the query square.
+        The grid is rebuilt on the first query of every tick, after entities
+        were spawned or removed, and after mark_moved(). Callers still check
+        alive and the exact distance.
+        """
+        cell = self.GRID_CELL_SIZE
+        if self._grid_time != self.game_time:
+            self._grid = {}
+            for entity in self.entities.values():
+                if entity.alive:
+                    key = (math.floor(entity.x / cell), math.floor(entity.y / cell))
+                    self._grid.setdefault(key, []).append(entity)
+            self._grid_time = self.game_time
+
+        cx0, cy0 = math.floor((x - radius) / cell), math.floor((y - radius) / cell)
+        cx1, cy1 = math.floor((x + radius) / cell), math.floor((y + radius) / cell)
+        found = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self._grid.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        # Same order as scanning self.entities (ids are handed out in order)
+        found.sort(key=lambda e: e.id)
+        return found
+
     def get_entity_at(self, x: float, y: float, radius: float = 0.5) -> Optional[Entity]:
         """Find entity near a position."""
-        for entity in self.entities.values():
+        for entity in self._nearby_entities(x, y, radius):
             if not entity.alive:
                 continue
             dx = entity.x - x
@@ -311,7 +427,7 @@ class World:
     def get_enemies_in_range(self, entity: Entity, range_: float) -> List[Entity]:
         """Find all enemy entities within range."""
         enemies = []
-        for other in self.entities.values():
+        for other in self._nearby_entities(entity.x, entity.y, range_):
             if not other.alive or other.team == entity.team:
                 continue
             dx = other.x - entity.x
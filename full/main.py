@@ -46,6 +46,7 @@ class Game:
 
     SIM_HZ = 30  # Simulation ticks per second
     SIM_DT = 1.0 / SIM_HZ
+    MAX_FRAME_TIME = 0.25  # Longest frame time fed into the loop (after stalls)
     CAMERA_SPEED = 15.0  # Tiles per second
 
     def __init__(self, verbose: bool = False, debug: bool = False, xmas: bool = False):
@@ -83,7 +84,7 @@ class Game:
 
         # Timing
         self.accumulator = 0.0
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()  # monotonic, high resolution
 
         # Selection & Build mode
         self.selection = SelectionManager()
@@ -106,8 +107,8 @@ class Game:
 
     def update(self) -> None:
         """Update game state with fixed timestep."""
-        current_time = time.time()
-        frame_time = current_time - self.last_time
+        current_time = time.perf_counter()
+        frame_time = min(current_time - self.last_time, self.MAX_FRAME_TIME)
         self.last_time = current_time
 
         self.accumulator += frame_time
@@ -329,7 +330,7 @@ class Game:
 
         # Reset timing
         self.accumulator = 0.0
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
 
         # Reset selection & build mode
         self.selection = SelectionManager()
@@ -465,7 +466,7 @@ def main():
                     if game.debug:
                         game.ai_logger = AILoggerHandler(log_file="ai_debug.log")
                     game.accumulator = 0.0
-                    game.last_time = time.time()
+                    game.last_time = time.perf_counter()
                     game.selection = SelectionManager()
                     game.build_mode = False
                     game.build_type = None
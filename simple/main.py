@@ -122,13 +122,13 @@ def main():
 
                 # Check what was clicked
                 clicked_entity = None
-                best_dist = 1.5  # Selection radius
+                best_dist_sq = 2.25  # Selection radius 1.5, squared
                 for entity in game.world.entities.values():
                     dx = entity.x - wx
                     dy = entity.y - wy
-                    dist = (dx * dx + dy * dy) ** 0.5
-                    if dist < best_dist:
-                        best_dist = dist
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < best_dist_sq:
+                        best_dist_sq = dist_sq
                         clicked_entity = entity
 
                 # Determine action: select own entity or command selected unit
@@ -5,6 +5,7 @@ Dieses Modul zeigt Python-Vererbung mit super() und
 das Laden von Stats aus JSON-Konfigurationsdateien.
 """
 from ..shared.config import UNIT_STATS, BUILDING_STATS
+from ..shared.kinds import EntityKind
 
 
 class Entity:
@@ -15,8 +16,13 @@ class Entity:
     - A team (1 = player, 2 = AI)
     - A position (x, y)
     - Health points
+
+    Every class declares __slots__ (no per-instance __dict__), which
+    makes entities smaller and attribute access faster.
     """
 
+    __slots__ = ("id", "team", "x", "y", "hp", "max_hp", "alive")
+
     def __init__(self, entity_id: int, team: int, pos: tuple, hp: int):
         self.id = entity_id
         self.team = team
@@ -39,6 +45,8 @@ class Unit(Entity):
     Adds speed and destination for movement.
     """
 
+    __slots__ = ("speed", "destination", "target")
+
     def __init__(self, entity_id: int, team: int, pos: tuple, hp: int, speed: float):
         super().__init__(entity_id, team, pos, hp)
         self.speed = speed
@@ -52,6 +60,10 @@ class Worker(Unit):
     Loads stats from units.json via UNIT_STATS dict.
     """
 
+    __slots__ = ("carrying", "gather_target", "vision", "state", "build_target")
+
+    KIND = EntityKind.WORKER  # Tag for fast type dispatch in the systems
+
     def __init__(self, entity_id: int, team: int, pos: tuple):
         stats = UNIT_STATS["Worker"]
         super().__init__(
@@ -72,6 +84,10 @@ class Soldier(Unit):
     Has damage, attack range, and cooldown.
     """
 
+    __slots__ = ("damage", "attack_range", "cooldown")
+
+    KIND = EntityKind.SOLDIER  # Tag for fast type dispatch in the systems
+
     def __init__(self, entity_id: int, team: int, pos: tuple):
         stats = UNIT_STATS["Soldier"]
         super().__init__(
@@ -90,6 +106,8 @@ class Building(Entity):
     Has production state (single item, no queue in simple version).
     """
 
+    __slots__ = ("current_production", "production_progress")
+
     def __init__(self, entity_id: int, team: int, pos: tuple, hp: int):
         super().__init__(entity_id, team, pos, hp)
         self.current_production = None  # "Worker" or "Soldier" or None
@@ -103,6 +121,10 @@ class Base(Building):
     If the Base is destroyed, the team loses.
     """
 
+    __slots__ = ()
+
+    KIND = EntityKind.BASE  # Tag for fast type dispatch in the systems
+
     def __init__(self, entity_id: int, team: int, pos: tuple):
         stats = BUILDING_STATS["Base"]
         super().__init__(entity_id, team, pos, stats["hp"])
@@ -120,6 +142,10 @@ class Barracks(Building):
     Must be built by a Worker.
     """
 
+    __slots__ = ()
+
+    KIND = EntityKind.BARRACKS  # Tag for fast type dispatch in the systems
+
     def __init__(self, entity_id: int, team: int, pos: tuple):
         stats = BUILDING_STATS["Barracks"]
         super().__init__(entity_id, team, pos, stats["hp"])
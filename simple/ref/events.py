@@ -125,6 +125,13 @@ class EventBus:
             except ValueError:
                 pass  # Handler wasn't subscribed
 
+    def has_subscribers(self, event_type: type) -> bool:
+        """Check whether any handler listens for an event type.
+
+        Lets hot loops skip building events that nobody would receive.
+        """
+        return bool(self._subscribers.get(event_type))
+
     def publish(self, event: Any) -> None:
         """Notify all handlers subscribed to this event's type.
 
@@ -135,6 +142,20 @@ class EventBus:
         for handler in self._subscribers.get(event_type, []):
             handler(event)
 
+    def publish_many(self, events: List[Any]) -> None:
+        """Publish several events in one go, in order.
+
+        Same as calling publish() for each event, e.g. for everything
+        spawned during Game.setup().
+
+        Args:
+            events: Event instances to publish
+        """
+        subscribers = self._subscribers
+        for event in events:
+            for handler in subscribers.get(type(event), []):
+                handler(event)
+
 
 # === Global EventBus Instance ===
 # Used by all systems and handlers in the game
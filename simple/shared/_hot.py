@@ -0,0 +1,72 @@
+"""
+Hot Loops
+Numeric kernels for the systems, compiled with Numba if it is installed.
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# What happened to a unit in apply_movement()
+MOVE_WALK = 0  # Moved toward its destination
+MOVE_SNAP = 1  # Reached its destination this step
+MOVE_ARRIVED = 2  # Was already there, did not move
+
+
+def _apply_movement_numpy(x, y, dest_x, dest_y, move_dist) -> np.ndarray:
+    """NumPy version of apply_movement()"""
+    # Calculate direction to destination
+    dx = dest_x - x
+    dy = dest_y - y
+    dist = np.sqrt(dx * dx + dy * dy)
+
+    arrived = dist < 0.1
+    snap = ~arrived & (move_dist >= dist)
+    walk = ~(arrived | snap)
+
+    # Normalize and apply speed (walkers have dist >= 0.1)
+    scale = np.where(walk, move_dist / np.maximum(dist, 0.1), 0.0)
+    x[:] = np.where(snap, dest_x, x + dx * scale)
+    y[:] = np.where(snap, dest_y, y + dy * scale)
+
+    return (snap * MOVE_SNAP + arrived * MOVE_ARRIVED).astype(np.int8)
+
+
+def _apply_movement_loop(x, y, dest_x, dest_y, move_dist, state) -> None:
+    """Loop version of apply_movement(), for Numba.
+
+    Written without if/else: units arrive at different times, so an
+    arrival branch would be mispredicted often. The conditional
+    expressions compile to selects.
+    """
+    for i in range(len(x)):
+        dx = dest_x[i] - x[i]
+        dy = dest_y[i] - y[i]
+        dist = math.sqrt(dx * dx + dy * dy)
+
+        arrived = dist < 0.1
+        snap = (move_dist[i] >= dist) & (not arrived)
+        scale = (move_dist[i] / max(dist, 0.1)) * (not (arrived | snap))
+
+        x[i] = dest_x[i] if snap else x[i] + dx * scale
+        y[i] = dest_y[i] if snap else y[i] + dy * scale
+        state[i] = snap * MOVE_SNAP + arrived * MOVE_ARRIVED
+
+
+if njit is not None:
+    _apply_movement_jit = njit(cache=True)(_apply_movement_loop)
+
+    def apply_movement(x, y, dest_x, dest_y, move_dist) -> np.ndarray:
+        """Move units toward their destinations (x and y are updated in place).
+
+        Returns one MOVE_* code per unit.
+        """
+        state = np.empty(len(x), dtype=np.int8)
+        _apply_movement_jit(x, y, dest_x, dest_y, move_dist, state)
+        return state
+else:
+    # Interpreted, the NumPy version is faster than the loop
+    apply_movement = _apply_movement_numpy
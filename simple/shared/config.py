@@ -2,9 +2,15 @@
 MicroCraft Configuration
 Contains game constants, file paths, and settings.
 """
-import json
+import functools
 from pathlib import Path
 
+# orjson parses much faster, but is optional - fall back to the stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -27,34 +33,90 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 SIM_HZ = 30  # Simulation ticks per second
+MAX_SIM_STEPS_PER_FRAME = 5  # Catch-up limit after a stall (avoids spiral of death)
+MAX_FRAME_DT = 0.25  # Longest frame time (seconds) fed into the game loop
 
 # Game balance
 MINERAL_GATHER_AMOUNT = 8
 MINERAL_GATHER_TIME = 2.0  # seconds to mine once
 MINERAL_RETURN_RANGE = 2.0  # tiles from base to drop off
+MINERAL_GATHER_RANGE = 1.5  # tiles from patch to mine
+BUILD_RANGE = 2.0  # tiles from site to construct
+
+# Squared ranges, for comparing against squared distances (no sqrt)
+MINERAL_RETURN_RANGE_SQ = MINERAL_RETURN_RANGE ** 2
+MINERAL_GATHER_RANGE_SQ = MINERAL_GATHER_RANGE ** 2
+BUILD_RANGE_SQ = BUILD_RANGE ** 2
+
+# Spatial grid for proximity queries (about one Soldier attack range)
+SPATIAL_CELL_SIZE = 4.0
 
 # AI timing
 AI_THINK_INTERVAL = 0.5  # seconds between AI decisions
 
 
+@functools.lru_cache(maxsize=1)
 def load_unit_stats() -> dict:
     """Load unit stats from units.json"""
-    with open(DATA_DIR / "units.json", "r") as f:
-        return json.load(f)
+    with open(DATA_DIR / "units.json", "rb") as f:
+        return _json_loads(f.read())
 
 
+@functools.lru_cache(maxsize=1)
 def load_building_stats() -> dict:
     """Load building stats from buildings.json"""
-    with open(DATA_DIR / "buildings.json", "r") as f:
-        return json.load(f)
+    with open(DATA_DIR / "buildings.json", "rb") as f:
+        return _json_loads(f.read())
 
 
+@functools.lru_cache(maxsize=1)
 def load_scenario() -> dict:
     """Load scenario configuration"""
-    with open(DATA_DIR / "scenario.json", "r") as f:
-        return json.load(f)
+    with open(DATA_DIR / "scenario.json", "rb") as f:
+        return _json_loads(f.read())
+
+
+def _stat_table(loader, key: str):
+    """Make a cached loader for {name: stats[key]} (one lookup instead of two)"""
+    @functools.lru_cache(maxsize=1)
+    def load() -> dict:
+        return {name: stats[key] for name, stats in loader().items()}
+    return load
+
+
+def _rate_table(loader):
+    """Make a cached loader for {name: 1 / build_time} (multiply, don't divide)"""
+    @functools.lru_cache(maxsize=1)
+    def load() -> dict:
+        return {name: 1.0 / stats["build_time"] for name, stats in loader().items()}
+    return load
+
+
+# Stats and scenario are read on first access, not at import time, so
+# importing config just for its constants stays cheap.
+# The dicts are cached and shared - treat them as read-only!
+_LAZY_CONSTANTS = {
+    "UNIT_STATS": load_unit_stats,  # used by entities.py
+    "BUILDING_STATS": load_building_stats,
+    "SCENARIO": load_scenario,
+    # Flat per-type tables, e.g. UNIT_COST["Worker"]
+    "UNIT_COST": _stat_table(load_unit_stats, "cost"),
+    "UNIT_BUILD_TIME": _stat_table(load_unit_stats, "build_time"),
+    "UNIT_BUILD_RATE": _rate_table(load_unit_stats),  # Production progress per second
+    "BUILDING_COST": _stat_table(load_building_stats, "cost"),
+    "BUILDING_BUILD_TIME": _stat_table(load_building_stats, "build_time"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve the data-file constants (UNIT_STATS, SCENARIO, ...) on first use"""
+    loader = _LAZY_CONSTANTS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return loader()
 
 
-# Pre-load stats for convenience (used by entities.py)
-UNIT_STATS = load_unit_stats()
-BUILDING_STATS = load_building_stats()
+def warmup() -> None:
+    """Load all data files now (fails early if one is missing or broken)"""
+    for loader in _LAZY_CONSTANTS.values():
+        loader()
@@ -3,17 +3,22 @@ Game Loop
 Main game class that ties everything together.
 """
 import time
-from typing import Optional, Any
+from typing import Callable, Optional, Any, Tuple
 from .world import World
-from .systems import MovementSystem, CombatSystem, ResourceSystem, ProductionSystem, AISystem, BuildingPlacementSystem
+from .systems import MovementSystem, CombatSystem, ResourceSystem, ProductionSystem, AISystem, BuildingPlacementSystem, WorkerPass
 from .particle_system import ParticleSystem
-from .config import TEAM_PLAYER, TEAM_AI, SIM_HZ, load_scenario
+from .kinds import EntityKind, UNIT_KINDS, BUILDING_KINDS, entity_kind
+from .config import TEAM_PLAYER, TEAM_AI, SIM_HZ, MAX_SIM_STEPS_PER_FRAME, MAX_FRAME_DT, SCENARIO, UNIT_COST, warmup
+
+# Building kind -> unit type it produces
+_PRODUCES = {EntityKind.BASE: "Worker", EntityKind.BARRACKS: "Soldier"}
 
 
 class Game:
     """Main game controller"""
 
     def __init__(self):
+        warmup()  # Read all data files up front, not in the middle of a game
         self.world = World()
         self.particles = ParticleSystem()
         self.running = True
@@ -34,8 +39,23 @@ class Game:
         self.building = BuildingPlacementSystem()
         self.ai = AISystem()
 
+        # Resources and building placement share one pass over the workers
+        self.workers = WorkerPass(self.resources, self.building)
+
+        # System updates in execution order (bound once, not every tick).
+        # Resources used to run before production: the worker pass runs after
+        # it instead, which changes nothing as production does not read
+        # minerals and a freshly spawned worker has no orders yet.
+        self._systems: Tuple[Callable[[World, float], None], ...] = (
+            self.movement.update,
+            self.combat.update,
+            self.production.update,
+            self.workers.update,
+            self.ai.update,
+        )
+
         # Timing
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()  # monotonic, high resolution
         self.sim_accumulator = 0.0
         self.sim_dt = 1.0 / SIM_HZ
 
@@ -44,8 +64,9 @@ class Game:
         from ..live.entities import Base, Worker
         from ..live.events import event_bus, SpawnEvent
 
-        scenario = load_scenario()
+        scenario = SCENARIO
         starting_workers = scenario.get("starting_workers", 3)
+        spawn_events = []  # Published together once everything is spawned
 
         # Spawn bases and workers for each team
         for team_id in [TEAM_PLAYER, TEAM_AI]:
@@ -57,7 +78,7 @@ class Game:
             base = Base(base_id, team_id, tuple(base_pos))
             self.world.add_entity(base)
 
-            event_bus.publish(SpawnEvent(
+            spawn_events.append(SpawnEvent(
                 kind="Base",
                 entity_id=base_id,
                 team=team_id,
@@ -72,24 +93,35 @@ class Game:
                 worker = Worker(worker_id, team_id, (wx, wy))
                 self.world.add_entity(worker)
 
-                event_bus.publish(SpawnEvent(
+                spawn_events.append(SpawnEvent(
                     kind="Worker",
                     entity_id=worker_id,
                     team=team_id,
                     pos=(wx, wy)
                 ))
 
+        # The live-coded EventBus may not have publish_many()
+        publish_many = getattr(event_bus, "publish_many", None)
+        if publish_many is not None:
+            publish_many(spawn_events)
+        else:
+            for event in spawn_events:
+                event_bus.publish(event)
+
     def update(self) -> None:
         """Update game state (called every frame)"""
-        current_time = time.time()
-        frame_dt = current_time - self.last_time
+        current_time = time.perf_counter()
+        frame_dt = min(current_time - self.last_time, MAX_FRAME_DT)
         self.last_time = current_time
 
         if self.paused:
             return
 
-        # Accumulate time for fixed timestep simulation
-        self.sim_accumulator += frame_dt
+        # Accumulate time for fixed timestep simulation.
+        # Capped, so after a long stall (window dragged, breakpoint) the
+        # simulation drops time instead of running hundreds of catch-up ticks.
+        self.sim_accumulator = min(self.sim_accumulator + frame_dt,
+                                   MAX_SIM_STEPS_PER_FRAME * self.sim_dt)
 
         while self.sim_accumulator >= self.sim_dt:
             self._sim_step(self.sim_dt)
@@ -98,17 +130,23 @@ class Game:
         # Update particles (can run at frame rate)
         self.particles.update(frame_dt)
 
+    @property
+    def interpolation_alpha(self) -> float:
+        """Progress from the last towards the next simulation tick (0.0 to 1.0).
+
+        Renderers can use this to interpolate positions between ticks.
+        Frame pacing itself is done by the renderer (clock.tick).
+        """
+        return self.sim_accumulator / self.sim_dt
+
     def _sim_step(self, dt: float) -> None:
         """One simulation step at fixed timestep"""
         self.world.game_time += dt
 
         # Update all systems
-        self.movement.update(self.world, dt)
-        self.combat.update(self.world, dt)
-        self.resources.update(self.world, dt)
-        self.production.update(self.world, dt)
-        self.building.update(self.world, dt)
-        self.ai.update(self.world, dt)
+        world = self.world
+        for update in self._systems:
+            update(world, dt)
 
         # Check victory
         self.world.check_victory()
@@ -117,18 +155,19 @@ class Game:
 
     def select_at(self, x: float, y: float) -> Optional[int]:
         """Select entity at world position"""
-        # Find entity near click position
+        # Find nearest own entity within the selection radius (1.5 tiles).
+        # A plain scan of the player's entities: a click is rare, and the
+        # entity table is usually stale after movement, so building it here
+        # would cost more than the scan.
         best = None
-        best_dist = 1.5  # Selection radius
+        best_dist_sq = 2.25  # 1.5^2
 
-        for entity in self.world.entities.values():
-            if entity.team != TEAM_PLAYER:
-                continue
+        for entity in self.world.get_entities_by_team(TEAM_PLAYER):
             dx = entity.x - x
             dy = entity.y - y
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < best_dist:
-                best_dist = dist
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < best_dist_sq:
+                best_dist_sq = dist_sq
                 best = entity.id
 
         self.selected_entity = best
@@ -136,18 +175,20 @@ class Game:
 
     def issue_command(self, target_x: float, target_y: float) -> None:
         """Issue move/attack command to selected unit"""
-        from ..live.entities import Unit, Worker, Soldier
         from ..live.events import event_bus, CommandEvent
 
         if self.selected_entity is None:
             return
 
         entity = self.world.get_entity(self.selected_entity)
-        if entity is None or not isinstance(entity, Unit):
+        if entity is None:
+            return
+        kind = entity_kind(entity)
+        if kind not in UNIT_KINDS:
             return
 
         # Handle build mode
-        if self.build_mode and self.build_type and isinstance(entity, Worker):
+        if self.build_mode and self.build_type and kind == EntityKind.WORKER:
             entity.build_target = (self.build_type, target_x, target_y)
             entity.destination = (target_x, target_y)  # Start moving to build site
             entity.gather_target = None  # Stop gathering
@@ -159,7 +200,7 @@ class Game:
 
         # Check if clicking on mineral (for workers)
         # Use nearest mineral within 1.5 tiles so clicking near a mineral works
-        if isinstance(entity, Worker):
+        if kind == EntityKind.WORKER:
             mineral = self.world.game_map.get_nearest_mineral(target_x, target_y)
             if mineral:
                 # Check if click was close enough to the mineral (within 1.5 tiles)
@@ -173,13 +214,15 @@ class Game:
                     return
 
         # Check if clicking on enemy (for attack)
-        for other in self.world.entities.values():
+        grid = self.world.get_spatial_grid()
+        for other_id in grid.query(target_x, target_y, 1.0):
+            other = self.world.entities[other_id]
             if other.team != entity.team and other.alive:
                 dx = other.x - target_x
                 dy = other.y - target_y
                 if abs(dx) < 1 and abs(dy) < 1:
                     # Clicked on enemy
-                    if isinstance(entity, Soldier):
+                    if kind == EntityKind.SOLDIER:
                         entity.target = other.id
                     entity.destination = (other.x, other.y)
                     # Publish command event
@@ -193,25 +236,24 @@ class Game:
 
     def start_build_mode(self) -> None:
         """Enter build mode for Barracks placement"""
-        from ..live.entities import Worker
-
         if self.selected_entity is None:
             return
 
         entity = self.world.get_entity(self.selected_entity)
-        if entity and isinstance(entity, Worker) and entity.team == TEAM_PLAYER:
+        if entity and entity_kind(entity) == EntityKind.WORKER and entity.team == TEAM_PLAYER:
             self.build_mode = True
             self.build_type = "Barracks"
 
     def request_production(self) -> bool:
         """Request selected building to produce a unit"""
-        from ..live.entities import Building, Base, Barracks
-
         if self.selected_entity is None:
             return False
 
         entity = self.world.get_entity(self.selected_entity)
-        if entity is None or not isinstance(entity, Building):
+        if entity is None:
+            return False
+        kind = entity_kind(entity)
+        if kind not in BUILDING_KINDS:
             return False
 
         if entity.team != TEAM_PLAYER:
@@ -221,16 +263,10 @@ class Game:
             return False  # Already producing
 
         # Determine what to produce
-        if isinstance(entity, Base):
-            unit_type = "Worker"
-        elif isinstance(entity, Barracks):
-            unit_type = "Soldier"
-        else:
-            return False
+        unit_type = _PRODUCES[kind]
 
         # Check cost
-        from .config import UNIT_STATS
-        cost = UNIT_STATS[unit_type]["cost"]
+        cost = UNIT_COST[unit_type]
         current = self.world.get_minerals(TEAM_PLAYER)
         if current < cost:
             print(f"Not enough minerals! Need {cost}, have {current}")
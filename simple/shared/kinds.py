@@ -0,0 +1,52 @@
+"""
+Entity Kinds
+Small integer tags for the entity classes, for cheap type dispatch.
+"""
+from enum import IntEnum
+from typing import Any, Dict
+
+
+class EntityKind(IntEnum):
+    """What an entity is (see entity_kind())"""
+    WORKER = 0
+    SOLDIER = 1
+    BASE = 2
+    BARRACKS = 3
+    OTHER = 4  # Any other Entity subclass
+
+
+UNIT_KINDS = (EntityKind.WORKER, EntityKind.SOLDIER)
+BUILDING_KINDS = (EntityKind.BASE, EntityKind.BARRACKS)
+
+# Entity class -> kind, filled on first sight of each class
+_KIND_BY_TYPE: Dict[type, EntityKind] = {}
+
+
+def _classify(cls: type) -> EntityKind:
+    """Find the kind of an entity class (walks the class hierarchy once)"""
+    # Classes may declare their kind, e.g. KIND = EntityKind.WORKER
+    kind = getattr(cls, "KIND", None)
+    if kind is not None:
+        return EntityKind(kind)
+
+    from ..live.entities import Worker, Soldier, Base, Barracks
+
+    for base_cls, kind in ((Worker, EntityKind.WORKER), (Soldier, EntityKind.SOLDIER),
+                           (Base, EntityKind.BASE), (Barracks, EntityKind.BARRACKS)):
+        if issubclass(cls, base_cls):
+            return kind
+    return EntityKind.OTHER
+
+
+def entity_kind(entity: Any) -> EntityKind:
+    """Get the kind of an entity.
+
+    The entity classes are live-coded, so a KIND class attribute is
+    optional. Either way the kind is looked up by class, which costs one
+    dict lookup instead of a chain of isinstance() checks.
+    """
+    cls = type(entity)
+    kind = _KIND_BY_TYPE.get(cls)
+    if kind is None:
+        kind = _KIND_BY_TYPE[cls] = _classify(cls)
+    return kind
@@ -2,11 +2,21 @@
 Map Loader
 Loads map from CSV and scenario from JSON.
 """
-import csv
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+import numpy as np
+
+# scipy is optional, without it nearest-mineral queries use plain NumPy
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
 from .config import DATA_DIR, TILE_GROUND, TILE_WALL, TILE_MINERAL, TILE_PLAYER_SPAWN, TILE_AI_SPAWN
 
+# Tiles that units cannot walk on
+_BLOCKING = frozenset((TILE_WALL, TILE_MINERAL))
+
 
 @dataclass
 class MineralPatch:
@@ -28,20 +38,47 @@ class MineralPatch:
 
 @dataclass
 class GameMap:
-    """The game world grid"""
+    """The game world grid.
+
+    The terrain is fixed once the map is built: walkability is computed
+    from the tiles in __post_init__, so don't change tiles afterwards.
+    Only the mineral patches change during a game.
+    """
     width: int
     height: int
-    tiles: List[List[int]] = field(default_factory=list)
+    tiles: Optional[np.ndarray] = None  # (height, width) int8, all ground if not given
     minerals: List[MineralPatch] = field(default_factory=list)
     player_spawn: Tuple[int, int] = (0, 0)
     ai_spawn: Tuple[int, int] = (0, 0)
+    # Row-major walkable flags for is_walkable(), indexing bytes beats a NumPy scalar lookup
+    _walkable: bytes = field(default=b"", init=False, repr=False, compare=False)
+    _mineral_by_cell: Dict[Tuple[int, int], MineralPatch] = field(init=False, repr=False)
+    # Non-depleted patches and their positions, see get_nearest_mineral()
+    _active_minerals: Optional[List[MineralPatch]] = field(default=None, init=False, repr=False)
+    _active_xy: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _active_tree: Optional[Any] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        """Build walkability lookups from the tile grid"""
+        if self.tiles is None:
+            self.tiles = np.full((self.height, self.width), TILE_GROUND, dtype=np.int8)
+        self.tiles = np.asarray(self.tiles, dtype=np.int8).reshape(self.height, self.width)
+        self._walkable = (~np.isin(self.tiles, list(_BLOCKING))).tobytes()
+
+        self._mineral_by_cell = {}
+        for mineral in self.minerals:
+            self._mineral_by_cell.setdefault((mineral.x, mineral.y), mineral)
+
+    def add_mineral(self, mineral: MineralPatch) -> None:
+        """Place a mineral patch on the map"""
+        self.minerals.append(mineral)
+        self._mineral_by_cell.setdefault((mineral.x, mineral.y), mineral)
+        self._active_minerals = None
 
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a tile can be walked on"""
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
-        tile = self.tiles[y][x]
-        return tile not in (TILE_WALL, TILE_MINERAL)
+        return (0 <= x < self.width and 0 <= y < self.height
+                and self._walkable[y * self.width + x] == 1)
 
     def is_buildable(self, x: int, y: int) -> bool:
         """Check if a building can be placed here"""
@@ -52,61 +89,72 @@ class GameMap:
 
     def get_mineral_at(self, x: int, y: int) -> Optional[MineralPatch]:
         """Get mineral patch at position, if any"""
-        for mineral in self.minerals:
-            if mineral.x == x and mineral.y == y and not mineral.depleted:
-                return mineral
-        return None
+        mineral = self._mineral_by_cell.get((x, y))
+        if mineral is None or mineral.depleted:
+            return None
+        return mineral
+
+    def _index_active_minerals(self) -> None:
+        """(Re)build the position index of non-depleted mineral patches"""
+        self._active_minerals = [m for m in self.minerals if not m.depleted]
+        self._active_xy = np.array([(m.x, m.y) for m in self._active_minerals],
+                                   dtype=np.float64).reshape(-1, 2)
+        self._active_tree = None
+        if cKDTree is not None and self._active_minerals:
+            self._active_tree = cKDTree(self._active_xy)
 
     def get_nearest_mineral(self, x: float, y: float) -> Optional[MineralPatch]:
         """Find the nearest non-depleted mineral patch"""
-        best = None
-        best_dist = float('inf')
-        for mineral in self.minerals:
-            if mineral.depleted:
-                continue
-            dist = (mineral.x - x) ** 2 + (mineral.y - y) ** 2
-            if dist < best_dist:
-                best_dist = dist
-                best = mineral
-        return best
+        # Patches only ever deplete, so the index is rebuilt lazily: only
+        # when the nearest indexed patch turns out to be depleted.
+        while True:
+            if self._active_minerals is None:
+                self._index_active_minerals()
+            if not self._active_minerals:
+                return None
+
+            if self._active_tree is not None:
+                i = int(self._active_tree.query((x, y))[1])
+            else:
+                dist = ((self._active_xy[:, 0] - x) ** 2
+                        + (self._active_xy[:, 1] - y) ** 2)
+                i = int(dist.argmin())
+
+            best = self._active_minerals[i]
+            if not best.depleted:
+                return best
+            self._active_minerals = None  # Index is stale, rebuild and retry
+
+
+def _take_marker(tiles: np.ndarray, marker: int) -> Tuple[int, int]:
+    """Replace a spawn marker with ground, return its (x, y) position"""
+    cells = np.argwhere(tiles == marker)  # (row, col) pairs in row-major order
+    if not cells.size:
+        return (0, 0)
+    tiles[cells[:, 0], cells[:, 1]] = TILE_GROUND
+    y, x = cells[-1]  # Last marker wins
+    return (int(x), int(y))
 
 
 def load_map(filename: str = "map.csv") -> GameMap:
     """Load map from CSV file"""
     filepath = DATA_DIR / filename
-    tiles = []
-    minerals = []
-    player_spawn = (0, 0)
-    ai_spawn = (0, 0)
-
-    with open(filepath, "r") as f:
-        reader = csv.reader(f)
-        for y, row in enumerate(reader):
-            tile_row = []
-            for x, cell in enumerate(row):
-                tile = int(cell)
-                tile_row.append(tile)
-
-                # Extract special markers
-                # Note: TILE_MINERAL (2) is only used for rendering
-                # Actual MineralPatch objects are loaded from scenario.json in World
-                if tile == TILE_PLAYER_SPAWN:
-                    player_spawn = (x, y)
-                    tile_row[-1] = TILE_GROUND  # Replace spawn marker with ground
-                elif tile == TILE_AI_SPAWN:
-                    ai_spawn = (x, y)
-                    tile_row[-1] = TILE_GROUND
-
-            tiles.append(tile_row)
-
-    height = len(tiles)
-    width = len(tiles[0]) if tiles else 0
+    # Parsed in C, straight into one (height, width) array
+    tiles = np.loadtxt(filepath, delimiter=",", dtype=np.int8, ndmin=2)
+
+    # Extract special markers
+    # Note: TILE_MINERAL (2) is only used for rendering
+    # Actual MineralPatch objects are loaded from scenario.json in World
+    player_spawn = _take_marker(tiles, TILE_PLAYER_SPAWN)
+    ai_spawn = _take_marker(tiles, TILE_AI_SPAWN)
+
+    height, width = tiles.shape
 
     return GameMap(
         width=width,
         height=height,
         tiles=tiles,
-        minerals=minerals,
+        minerals=[],
         player_spawn=player_spawn,
         ai_spawn=ai_spawn
     )
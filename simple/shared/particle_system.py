@@ -1,16 +1,88 @@
 """
 Particle System
 Lightweight particle effects for explosions, sparkles, etc.
+
+Particles are stored as a Structure of Arrays (one NumPy array per field)
+so that update() runs as a handful of vectorized operations instead of a
+Python loop over particle objects. If Numba is installed, update() runs
+as a single compiled loop instead (optional, same results).
 """
 import math
-import random
-from dataclasses import dataclass, field
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _update_numpy(x, y, vx, vy, lifetime, max_lifetime, size, color, dt, n):
+    """Move the first n particles and compact out the dead ones.
+
+    Survivors keep their order, so index 0 stays the oldest. Returns the
+    new count.
+    """
+    arrays = (x, y, vx, vy, lifetime, max_lifetime, size, color)
+    x, y = x[:n], y[:n]
+    vx, vy = vx[:n], vy[:n]
+    live_lifetime = lifetime[:n]
+
+    # Update particles in place (vx * dt etc. still make small temporaries)
+    x += vx * dt
+    y += vy * dt
+    live_lifetime -= dt
+
+    # Add some gravity/drag
+    vy += 50 * dt  # Gravity
+    vx *= 0.98  # Drag
+    vy *= 0.98
+
+    # Remove dead particles (keeps order, so index 0 stays the oldest)
+    alive = live_lifetime > 0
+    if alive.all():
+        return n
+    keep = np.flatnonzero(alive)
+    for arr in arrays:
+        arr[:len(keep)] = arr[keep]
+    return len(keep)
+
+
+def _update_loop(x, y, vx, vy, lifetime, max_lifetime, size, color, dt, n):
+    """Same as _update_numpy(), as one loop for Numba to compile"""
+    keep = 0
+    for i in range(n):
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        lifetime[i] -= dt
+        vx[i] *= 0.98  # Drag
+        vy[i] = (vy[i] + 50 * dt) * 0.98  # Gravity, then drag
+        if lifetime[i] > 0:
+            if keep != i:
+                x[keep] = x[i]
+                y[keep] = y[i]
+                vx[keep] = vx[i]
+                vy[keep] = vy[i]
+                lifetime[keep] = lifetime[i]
+                max_lifetime[keep] = max_lifetime[i]
+                size[keep] = size[i]
+                color[keep] = color[i]
+            keep += 1
+    return keep
+
+
+if njit is not None:
+    _update_particles = njit(cache=True, fastmath=True)(_update_loop)
+else:
+    # Interpreted, the NumPy version is faster than the loop
+    _update_particles = _update_numpy
 
 
 @dataclass
 class Particle:
-    """A single particle"""
+    """A single particle (read-only snapshot for rendering)"""
     x: float
     y: float
     vx: float
@@ -30,12 +102,132 @@ class Particle:
         return self.lifetime > 0
 
 
+class ParticleView:
+    """Read-only view on the live particles of a ParticleSystem.
+
+    Exposes the underlying arrays (sliced to the live particles) for
+    renderers that can draw in bulk, and still iterates as Particle
+    objects for renderers that draw one particle at a time.
+    """
+
+    def __init__(self, system: 'ParticleSystem'):
+        n = system.alive_count
+        self.x = system.x[:n]
+        self.y = system.y[:n]
+        self.vx = system.vx[:n]
+        self.vy = system.vy[:n]
+        self.lifetime = system.lifetime[:n]
+        self.max_lifetime = system.max_lifetime[:n]
+        self.size = system.size[:n]
+        self.color = system.color[:n]
+        self.palette = system.palette
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self) -> Iterator[Particle]:
+        palette = self.palette
+        for i in range(len(self.x)):
+            yield Particle(
+                x=float(self.x[i]), y=float(self.y[i]),
+                vx=float(self.vx[i]), vy=float(self.vy[i]),
+                color=palette[self.color[i]],
+                lifetime=float(self.lifetime[i]),
+                max_lifetime=float(self.max_lifetime[i]),
+                size=int(self.size[i])
+            )
+
+
 class ParticleSystem:
     """Manages all active particles"""
 
+    # Palette size that triggers dropping colors no live particle uses
+    MAX_PALETTE = 256
+
     def __init__(self, max_particles: int = 500):
-        self.particles: List[Particle] = []
         self.max_particles = max_particles
+        self.alive_count = 0
+        self._next_slot = 0  # Slot to overwrite when the buffer is full
+
+        # One array per particle field, live particles are in [0, alive_count)
+        self.x = np.zeros(max_particles, dtype=np.float32)
+        self.y = np.zeros(max_particles, dtype=np.float32)
+        self.vx = np.zeros(max_particles, dtype=np.float32)
+        self.vy = np.zeros(max_particles, dtype=np.float32)
+        self.lifetime = np.zeros(max_particles, dtype=np.float32)
+        self.max_lifetime = np.zeros(max_particles, dtype=np.float32)
+        self.size = np.zeros(max_particles, dtype=np.float32)
+        self.color = np.zeros(max_particles, dtype=np.int16)  # index into palette
+
+        # Color strings are stored once, particles only keep an index
+        self.palette: List[str] = []
+        self._palette_index: Dict[str, int] = {}
+
+        self._rng = np.random.default_rng()
+
+    @property
+    def particles(self) -> ParticleView:
+        """Live particles (same as get_particles())"""
+        return self.get_particles()
+
+    def _compact_palette(self) -> None:
+        """Keep only the colors of live particles and renumber them"""
+        n = self.alive_count
+        used, self.color[:n] = np.unique(self.color[:n], return_inverse=True)
+        self.palette = [self.palette[i] for i in used]
+        self._palette_index = {c: i for i, c in enumerate(self.palette)}
+
+    def _color_indices(self, colors: List[str]) -> np.ndarray:
+        """Get palette indices for colors, adding new ones.
+
+        Call this before claiming slots, so that a compaction only sees
+        the colors of particles that are already set up.
+        """
+        if len(self.palette) + len(colors) > self.MAX_PALETTE:
+            self._compact_palette()
+        return np.array([self._color_index(c) for c in colors], dtype=np.int16)
+
+    def _color_index(self, color: str) -> int:
+        """Get palette index for a color, adding it if new"""
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def _claim_slot(self) -> int:
+        """Get the slot for a new particle.
+
+        When the buffer is full, the oldest particles are overwritten in
+        ring-buffer order instead of shifting all others down.
+        """
+        if self.alive_count < self.max_particles:
+            self.alive_count += 1
+            return self.alive_count - 1
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.max_particles
+        return slot
+
+    def _claim_slots(self, count: int) -> slice | np.ndarray:
+        """Get the slots for count new particles (count <= max_particles)"""
+        free = self.max_particles - self.alive_count
+        if count <= free:
+            start = self.alive_count
+            self.alive_count += count
+            return slice(start, start + count)
+
+        # Fill the free slots, then overwrite the oldest in ring order
+        overwrite = count - free
+        ring = (self._next_slot + np.arange(overwrite)) % self.max_particles
+        self._next_slot = (self._next_slot + overwrite) % self.max_particles
+        slots = np.concatenate((np.arange(self.alive_count, self.max_particles), ring))
+        self.alive_count = self.max_particles
+        return slots
+
+    def _arrays(self) -> tuple:
+        return (self.x, self.y, self.vx, self.vy, self.lifetime,
+                self.max_lifetime, self.size, self.color)
 
     def spawn(
         self,
@@ -48,23 +240,19 @@ class ParticleSystem:
         size: int = 3
     ) -> None:
         """Spawn a new particle"""
-        if len(self.particles) >= self.max_particles:
-            # Remove oldest particle
-            self.particles.pop(0)
-
         # Convert angle to velocity
         rad = math.radians(angle)
-        vx = math.cos(rad) * speed
-        vy = math.sin(rad) * speed
-
-        self.particles.append(Particle(
-            x=x, y=y,
-            vx=vx, vy=vy,
-            color=color,
-            lifetime=lifetime,
-            max_lifetime=lifetime,
-            size=size
-        ))
+        color_id = self._color_indices([color])[0]
+
+        i = self._claim_slot()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(rad) * speed
+        self.vy[i] = math.sin(rad) * speed
+        self.lifetime[i] = lifetime
+        self.max_lifetime[i] = lifetime
+        self.size[i] = size
+        self.color[i] = color_id
 
     def spawn_burst(
         self,
@@ -80,35 +268,49 @@ class ParticleSystem:
         max_size: int = 5
     ) -> None:
         """Spawn a burst of particles in random directions"""
-        for _ in range(count):
-            angle = random.uniform(0, 360)
-            speed = random.uniform(min_speed, max_speed)
-            color = random.choice(colors)
-            lifetime = random.uniform(min_lifetime, max_lifetime)
-            size = random.randint(min_size, max_size)
+        # More particles than fit would only overwrite each other
+        count = min(count, self.max_particles)
+        if count <= 0:
+            return
+
+        rng = self._rng
+        angles = rng.uniform(0.0, 2.0 * math.pi, count)
+        speeds = rng.uniform(min_speed, max_speed, count)
+        lifetimes = rng.uniform(min_lifetime, max_lifetime, count)
+        palette_ids = self._color_indices(colors)
 
-            self.spawn(x, y, angle, speed, color, lifetime, size)
+        slots = self._claim_slots(count)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = np.cos(angles) * speeds
+        self.vy[slots] = np.sin(angles) * speeds
+        self.lifetime[slots] = lifetimes
+        self.max_lifetime[slots] = lifetimes
+        self.size[slots] = rng.integers(min_size, max_size + 1, count)
+        self.color[slots] = palette_ids[rng.integers(0, len(colors), count)]
 
     def update(self, dt: float) -> None:
         """Update all particles"""
-        # Update particles
-        for p in self.particles:
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.lifetime -= dt
+        n = self.alive_count
+        if n == 0:
+            return
 
-            # Add some gravity/drag
-            p.vy += 50 * dt  # Gravity
-            p.vx *= 0.98  # Drag
-            p.vy *= 0.98
+        if self._next_slot:
+            # The ring has wrapped: rotate the oldest particle back to index 0,
+            # the update keeps the order and so the oldest at the front
+            for arr in self._arrays():
+                arr[:] = np.roll(arr, -self._next_slot)
+            self._next_slot = 0
 
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
+        self.alive_count = _update_particles(*self._arrays(), dt, n)
 
     def clear(self) -> None:
         """Remove all particles"""
-        self.particles.clear()
+        self.alive_count = 0
+        self._next_slot = 0
+        self.palette = []
+        self._palette_index = {}
 
-    def get_particles(self) -> List[Particle]:
+    def get_particles(self) -> ParticleView:
         """Get all active particles for rendering"""
-        return self.particles
+        return ParticleView(self)
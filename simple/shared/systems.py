@@ -2,64 +2,87 @@
 Game Systems
 Pre-built systems that use the live-coded entities and events.
 """
-import math
 from typing import TYPE_CHECKING
+import numpy as np
 from .config import (
-    TEAM_PLAYER, TEAM_AI, UNIT_STATS, BUILDING_STATS,
-    MINERAL_GATHER_AMOUNT, MINERAL_GATHER_TIME, MINERAL_RETURN_RANGE,
+    TEAM_PLAYER, TEAM_AI, UNIT_STATS, UNIT_COST, UNIT_BUILD_RATE,
+    BUILDING_COST, BUILDING_BUILD_TIME,
+    MINERAL_GATHER_AMOUNT, MINERAL_GATHER_TIME, MINERAL_RETURN_RANGE_SQ,
+    MINERAL_GATHER_RANGE_SQ, BUILD_RANGE_SQ,
     AI_THINK_INTERVAL, SIM_HZ
 )
 from .commands import MoveTo, AttackMove, Attack, Gather, ReturnResources, Produce
+from .kinds import EntityKind, UNIT_KINDS, BUILDING_KINDS
+from ._hot import apply_movement, MOVE_WALK, MOVE_SNAP, MOVE_ARRIVED
 
 if TYPE_CHECKING:
     from .world import World
 
+# Stats never change at runtime, so look them up once instead of per entity
+_SOLDIER_COOLDOWN = UNIT_STATS["Soldier"]["cooldown"]
+_WORKER_COST = UNIT_COST["Worker"]
+_SOLDIER_COST = UNIT_COST["Soldier"]
+_BARRACKS_COST = BUILDING_COST["Barracks"]
 
-class MovementSystem:
-    """Moves units toward their destinations"""
 
-    def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Unit
+def _has_subscribers(event_bus, event_type: type) -> bool:
+    """Check if an event type has listeners (so hot loops can skip building it)"""
+    # The live-coded EventBus may not have has_subscribers()
+    has_subscribers = getattr(event_bus, "has_subscribers", None)
+    return has_subscribers is None or has_subscribers(event_type)
 
-        for entity in list(world.entities.values()):
-            if not isinstance(entity, Unit) or not entity.alive:
-                continue
 
-            if entity.destination is None:
-                continue
+class MovementSystem:
+    """Moves units toward their destinations"""
 
-            # Calculate direction to destination
-            dx = entity.destination[0] - entity.x
-            dy = entity.destination[1] - entity.y
-            dist = math.sqrt(dx * dx + dy * dy)
+    def update(self, world: 'World', dt: float) -> None:
+        movers = [e for e in world.iter_kind(*UNIT_KINDS)
+                  if e.alive and e.destination is not None]
+        if not movers:
+            return
 
-            if dist < 0.1:
-                # Arrived
-                entity.destination = None
-                continue
+        # Gather into arrays, then move all units at once
+        n = len(movers)
+        x = np.fromiter((e.x for e in movers), dtype=np.float64, count=n)
+        y = np.fromiter((e.y for e in movers), dtype=np.float64, count=n)
+        dest_x = np.fromiter((e.destination[0] for e in movers), dtype=np.float64, count=n)
+        dest_y = np.fromiter((e.destination[1] for e in movers), dtype=np.float64, count=n)
+        move_dist = np.fromiter((e.speed for e in movers), dtype=np.float64, count=n) * dt
+
+        # Moves x, y in place (compiled with Numba if available)
+        state = apply_movement(x, y, dest_x, dest_y, move_dist)
+
+        # Write back
+        for i in np.flatnonzero(state == MOVE_WALK):
+            entity = movers[i]
+            entity.x = float(x[i])
+            entity.y = float(y[i])
+        for i in np.flatnonzero(state == MOVE_SNAP):
+            entity = movers[i]
+            entity.x, entity.y = entity.destination  # Exactly on target
+            entity.destination = None
+        for i in np.flatnonzero(state == MOVE_ARRIVED):
+            movers[i].destination = None
 
-            # Normalize and apply speed
-            move_dist = entity.speed * dt
-            if move_dist >= dist:
-                # Will arrive this frame
-                entity.x = entity.destination[0]
-                entity.y = entity.destination[1]
-                entity.destination = None
-            else:
-                # Move toward destination
-                entity.x += (dx / dist) * move_dist
-                entity.y += (dy / dist) * move_dist
+        # Later queries this tick must see the new positions
+        world.mark_moved()
 
 
 class CombatSystem:
     """Handles combat between units"""
 
     def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Soldier
+        if not world.has_kind(EntityKind.SOLDIER):
+            return  # Nobody to fight (e.g. early game)
+
         from ..live.events import event_bus, DeathEvent, AttackEvent
 
-        for entity in list(world.entities.values()):
-            if not isinstance(entity, Soldier) or not entity.alive:
+        # Attacks are the most frequent event, only build them if heard
+        publish_attacks = _has_subscribers(event_bus, AttackEvent)
+
+        # Snapshot: soldiers can die (and be removed) during the loop
+        for entity in tuple(world.iter_kind(EntityKind.SOLDIER)):
+            if not entity.alive:
                 continue
 
             # Reduce cooldown
@@ -87,24 +110,25 @@ class CombatSystem:
             # Check range
             dx = target.x - entity.x
             dy = target.y - entity.y
-            dist = math.sqrt(dx * dx + dy * dy)
+            attack_range = entity.attack_range
 
-            if dist > entity.attack_range:
+            if dx * dx + dy * dy > attack_range * attack_range:
                 # Move toward target
                 entity.destination = (target.x, target.y)
                 continue
 
             # Attack!
             target.hp -= entity.damage
-            entity.cooldown = UNIT_STATS["Soldier"]["cooldown"]
+            entity.cooldown = _SOLDIER_COOLDOWN
 
             # Publish attack event (for sound effects)
-            event_bus.publish(AttackEvent(
-                attacker_id=entity.id,
-                target_id=target.id,
-                team=entity.team,
-                pos=(entity.x, entity.y)
-            ))
+            if publish_attacks:
+                event_bus.publish(AttackEvent(
+                    attacker_id=entity.id,
+                    target_id=target.id,
+                    team=entity.team,
+                    pos=(entity.x, entity.y)
+                ))
 
             # Check for death
             if target.hp <= 0:
@@ -131,106 +155,100 @@ class ResourceSystem:
         self.gather_timers = {}  # worker_id -> time remaining
 
     def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Worker, Base
-        from ..live.events import event_bus, ResourceCollectedEvent, GatherStartEvent
-
-        for entity in list(world.entities.values()):
-            if not isinstance(entity, Worker) or not entity.alive:
-                continue
+        for entity in world.iter_kind(EntityKind.WORKER):
+            if entity.alive:
+                self.update_worker(world, entity, dt)
 
-            # If carrying resources, head to base
-            if entity.carrying > 0:
-                base = world.get_base(entity.team)
-                if base:
-                    # Check if close enough to drop off
-                    dx = base.x - entity.x
-                    dy = base.y - entity.y
-                    dist = math.sqrt(dx * dx + dy * dy)
-
-                    if dist <= MINERAL_RETURN_RANGE:
-                        # Deliver resources
-                        world.add_minerals(entity.team, entity.carrying)
-                        total = world.get_minerals(entity.team)
-
-                        event_bus.publish(ResourceCollectedEvent(
-                            worker_id=entity.id,
-                            team=entity.team,
-                            amount=entity.carrying,
-                            team_total=total
-                        ))
-
-                        entity.carrying = 0
-                        # Go back to mineral patch
-                        if entity.gather_target:
-                            entity.destination = (entity.gather_target.x, entity.gather_target.y)
-                    else:
-                        # Move to base
-                        entity.destination = (base.x, base.y)
-                continue
+    def update_worker(self, world: 'World', entity, dt: float) -> None:
+        """Gather / deliver for one living worker"""
+        from ..live.events import event_bus, ResourceCollectedEvent, GatherStartEvent
 
-            # If has a gather target, move to it and gather
-            if entity.gather_target:
-                mineral = entity.gather_target
-                if mineral.depleted:
-                    # Find new mineral
-                    entity.gather_target = world.game_map.get_nearest_mineral(entity.x, entity.y)
+        # If carrying resources, head to base
+        if entity.carrying > 0:
+            base = world.get_base(entity.team)
+            if base:
+                # Check if close enough to drop off
+                dx = base.x - entity.x
+                dy = base.y - entity.y
+                if dx * dx + dy * dy <= MINERAL_RETURN_RANGE_SQ:
+                    # Deliver resources
+                    world.add_minerals(entity.team, entity.carrying)
+                    total = world.get_minerals(entity.team)
+
+                    event_bus.publish(ResourceCollectedEvent(
+                        worker_id=entity.id,
+                        team=entity.team,
+                        amount=entity.carrying,
+                        team_total=total
+                    ))
+
+                    entity.carrying = 0
+                    # Go back to mineral patch
                     if entity.gather_target:
                         entity.destination = (entity.gather_target.x, entity.gather_target.y)
-                    continue
-
-                # Check if close enough to gather
-                dx = mineral.x - entity.x
-                dy = mineral.y - entity.y
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist <= 1.5:
-                    # Gathering
-                    if entity.id not in self.gather_timers:
-                        self.gather_timers[entity.id] = MINERAL_GATHER_TIME
-                        # Publish gather start event (for mining sound)
+                else:
+                    # Move to base
+                    entity.destination = (base.x, base.y)
+            return
+
+        # If has a gather target, move to it and gather
+        if entity.gather_target:
+            mineral = entity.gather_target
+            if mineral.depleted:
+                # Find new mineral
+                entity.gather_target = world.game_map.get_nearest_mineral(entity.x, entity.y)
+                if entity.gather_target:
+                    entity.destination = (entity.gather_target.x, entity.gather_target.y)
+                return
+
+            # Check if close enough to gather
+            dx = mineral.x - entity.x
+            dy = mineral.y - entity.y
+            if dx * dx + dy * dy <= MINERAL_GATHER_RANGE_SQ:
+                # Gathering
+                if entity.id not in self.gather_timers:
+                    self.gather_timers[entity.id] = MINERAL_GATHER_TIME
+                    # Publish gather start event (for mining sound)
+                    if _has_subscribers(event_bus, GatherStartEvent):
                         event_bus.publish(GatherStartEvent(
                             worker_id=entity.id,
                             team=entity.team,
                             pos=(mineral.x, mineral.y)
                         ))
 
-                    self.gather_timers[entity.id] -= dt
+                self.gather_timers[entity.id] -= dt
 
-                    if self.gather_timers[entity.id] <= 0:
-                        # Harvest complete
-                        amount = mineral.harvest(MINERAL_GATHER_AMOUNT)
-                        entity.carrying = amount
-                        del self.gather_timers[entity.id]
-                else:
-                    # Move to mineral
-                    entity.destination = (mineral.x, mineral.y)
+                if self.gather_timers[entity.id] <= 0:
+                    # Harvest complete
+                    amount = mineral.harvest(MINERAL_GATHER_AMOUNT)
+                    entity.carrying = amount
+                    del self.gather_timers[entity.id]
+            else:
+                # Move to mineral (a started harvest resumes on return)
+                entity.destination = (mineral.x, mineral.y)
 
 
 class ProductionSystem:
     """Handles building production queues"""
 
     def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Building, Base, Barracks, Worker, Soldier
+        from ..live.entities import Worker, Soldier
         from ..live.events import event_bus, SpawnEvent
 
-        for entity in list(world.entities.values()):
-            if not isinstance(entity, Building) or not entity.alive:
-                continue
-
-            if entity.current_production is None:
+        # Only buildings, not every entity; in id order like world.entities
+        buildings = sorted(world.iter_kind(*BUILDING_KINDS), key=lambda b: b.id)
+        for entity in buildings:
+            if not entity.alive or entity.current_production is None:
                 continue
 
-            # Get production time
+            # Get production rate (1 / build time)
             unit_type = entity.current_production
-            if unit_type == "Worker":
-                build_time = UNIT_STATS["Worker"]["build_time"]
-            elif unit_type == "Soldier":
-                build_time = UNIT_STATS["Soldier"]["build_time"]
-            else:
+            build_rate = UNIT_BUILD_RATE.get(unit_type)
+            if build_rate is None:
                 continue
 
             # Progress production
-            entity.production_progress += dt / build_time
+            entity.production_progress += dt * build_rate
 
             if entity.production_progress >= 1.0:
                 # Production complete - spawn unit
@@ -267,7 +285,7 @@ class AISystem:
         self.state = "build_workers"  # build_workers -> build_barracks -> attack
 
     def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Worker, Soldier, Base, Barracks
+        from ..live.entities import Barracks
 
         self.think_timer += dt
         if self.think_timer < AI_THINK_INTERVAL:
@@ -275,11 +293,10 @@ class AISystem:
         self.think_timer = 0.0
 
         # Get AI entities
-        workers = [e for e in world.get_units_by_team(TEAM_AI) if isinstance(e, Worker)]
-        soldiers = [e for e in world.get_units_by_team(TEAM_AI) if isinstance(e, Soldier)]
-        buildings = world.get_buildings_by_team(TEAM_AI)
+        workers = world.get_team_kind(TEAM_AI, EntityKind.WORKER)
+        soldiers = world.get_team_kind(TEAM_AI, EntityKind.SOLDIER)
         base = world.get_base(TEAM_AI)
-        barracks = [b for b in buildings if isinstance(b, Barracks)]
+        barracks = world.get_team_kind(TEAM_AI, EntityKind.BARRACKS)
 
         minerals = world.get_minerals(TEAM_AI)
 
@@ -287,18 +304,10 @@ class AISystem:
         if self.state == "build_workers":
             # Build workers until we have 5
             if len(workers) < 5 and base:
-                if base.current_production is None and minerals >= UNIT_STATS["Worker"]["cost"]:
-                    if world.spend_minerals(TEAM_AI, UNIT_STATS["Worker"]["cost"]):
+                if base.current_production is None and minerals >= _WORKER_COST:
+                    if world.spend_minerals(TEAM_AI, _WORKER_COST):
                         base.start_production()
 
-            # Ensure workers are gathering
-            for worker in workers:
-                if worker.gather_target is None and worker.carrying == 0:
-                    mineral = world.game_map.get_nearest_mineral(worker.x, worker.y)
-                    if mineral:
-                        worker.gather_target = mineral
-                        worker.destination = (mineral.x, mineral.y)
-
             # Transition: have 5 workers
             if len(workers) >= 5:
                 self.state = "build_barracks"
@@ -306,8 +315,8 @@ class AISystem:
         elif self.state == "build_barracks":
             # Build a barracks if we don't have one
             if not barracks:
-                if minerals >= BUILDING_STATS["Barracks"]["cost"]:
-                    if world.spend_minerals(TEAM_AI, BUILDING_STATS["Barracks"]["cost"]):
+                if minerals >= _BARRACKS_COST:
+                    if world.spend_minerals(TEAM_AI, _BARRACKS_COST):
                         # Place barracks near base
                         if base:
                             bx, by = base.x + 4, base.y
@@ -325,22 +334,14 @@ class AISystem:
             else:
                 # Have barracks, build soldiers
                 my_barracks = barracks[0]
-                if my_barracks.current_production is None and minerals >= UNIT_STATS["Soldier"]["cost"]:
-                    if world.spend_minerals(TEAM_AI, UNIT_STATS["Soldier"]["cost"]):
+                if my_barracks.current_production is None and minerals >= _SOLDIER_COST:
+                    if world.spend_minerals(TEAM_AI, _SOLDIER_COST):
                         my_barracks.start_production()
 
                 # Transition: have 6 soldiers
                 if len(soldiers) >= 6:
                     self.state = "attack"
 
-            # Keep workers gathering
-            for worker in workers:
-                if worker.gather_target is None and worker.carrying == 0:
-                    mineral = world.game_map.get_nearest_mineral(worker.x, worker.y)
-                    if mineral:
-                        worker.gather_target = mineral
-                        worker.destination = (mineral.x, mineral.y)
-
         elif self.state == "attack":
             # Attack the player base
             player_base = world.get_base(TEAM_PLAYER)
@@ -354,17 +355,21 @@ class AISystem:
             # Keep building soldiers
             if barracks:
                 my_barracks = barracks[0]
-                if my_barracks.current_production is None and minerals >= UNIT_STATS["Soldier"]["cost"]:
-                    if world.spend_minerals(TEAM_AI, UNIT_STATS["Soldier"]["cost"]):
+                if my_barracks.current_production is None and minerals >= _SOLDIER_COST:
+                    if world.spend_minerals(TEAM_AI, _SOLDIER_COST):
                         my_barracks.start_production()
 
-            # Keep workers gathering
-            for worker in workers:
-                if worker.gather_target is None and worker.carrying == 0:
-                    mineral = world.game_map.get_nearest_mineral(worker.x, worker.y)
-                    if mineral:
-                        worker.gather_target = mineral
-                        worker.destination = (mineral.x, mineral.y)
+        # Keep workers gathering (in every state)
+        self._assign_idle_workers(world, workers)
+
+    def _assign_idle_workers(self, world: 'World', workers: list) -> None:
+        """Send workers that neither gather nor carry to the nearest mineral"""
+        for worker in workers:
+            if worker.gather_target is None and worker.carrying == 0:
+                mineral = world.game_map.get_nearest_mineral(worker.x, worker.y)
+                if mineral:
+                    worker.gather_target = mineral
+                    worker.destination = (mineral.x, mineral.y)
 
 
 class BuildingPlacementSystem:
@@ -380,79 +385,113 @@ class BuildingPlacementSystem:
         self._last_mineral_warning = 0.0  # Timestamp of last warning
 
     def update(self, world: 'World', dt: float) -> None:
-        from ..live.entities import Worker, Barracks
-        from ..live.events import event_bus, SpawnEvent
+        if not self.remove_stale_timers(world):
+            return
+
+        # New Barracks go to another kind, so the live index is safe here
+        for entity in world.iter_kind(EntityKind.WORKER):
+            if entity.alive:
+                self.update_worker(world, entity, dt)
+
+    def remove_stale_timers(self, world: 'World') -> bool:
+        """Drop timers of removed workers, return False if there are no workers.
+
+        Dead workers are removed from the world by the CombatSystem, so
+        this also covers them.
+        """
+        if not world.has_kind(EntityKind.WORKER):
+            self._build_timers.clear()  # Nobody left to build
+            return False
 
-        # Clean up timers for workers that no longer exist
         stale_ids = [wid for wid in self._build_timers if wid not in world.entities]
         for wid in stale_ids:
             del self._build_timers[wid]
+        return True
 
-        for entity in list(world.entities.values()):
-            if not isinstance(entity, Worker) or not entity.alive:
-                # Clean up timer for dead workers
-                if entity.id in self._build_timers:
-                    del self._build_timers[entity.id]
-                continue
+    def update_worker(self, world: 'World', entity, dt: float) -> None:
+        """Move to the build site / construct for one living worker"""
+        if entity.build_target is None:  # Part of the Worker interface
+            return
 
-            if not hasattr(entity, 'build_target') or entity.build_target is None:
-                continue
+        from ..live.entities import Barracks
+        from ..live.events import event_bus, SpawnEvent
+
+        building_type, bx, by = entity.build_target
 
-            building_type, bx, by = entity.build_target
+        # Move to build site
+        dx = bx - entity.x
+        dy = by - entity.y
+        if dx * dx + dy * dy > BUILD_RANGE_SQ:
+            entity.destination = (bx, by)
+            return
 
-            # Move to build site
-            dx = bx - entity.x
-            dy = by - entity.y
-            dist = math.sqrt(dx * dx + dy * dy)
+        # At build site - stop moving
+        entity.destination = None
+
+        # Check if we can afford it
+        cost = BUILDING_COST[building_type]
+        current = world.get_minerals(entity.team)
+        if current < cost:
+            # Cancel build and warn player (max once per second)
+            if entity.team == TEAM_PLAYER:
+                if world.game_time - self._last_mineral_warning >= 1.0:
+                    print(f"Not enough minerals for {building_type}! Need {cost}, have {current}")
+                    self._last_mineral_warning = world.game_time
+            # Cancel the build attempt - worker goes idle
+            entity.build_target = None
+            return
 
-            if dist > 2.0:
-                entity.destination = (bx, by)
-                continue
+        # Progress building timer
+        if entity.id not in self._build_timers:
+            self._build_timers[entity.id] = 0.0
 
-            # At build site - stop moving
-            entity.destination = None
+        self._build_timers[entity.id] += dt
+        build_time = BUILDING_BUILD_TIME[building_type]
 
-            # Check if we can afford it
-            cost = BUILDING_STATS[building_type]["cost"]
-            current = world.get_minerals(entity.team)
-            if current < cost:
-                # Cancel build and warn player (max once per second)
-                if entity.team == TEAM_PLAYER:
-                    if world.game_time - self._last_mineral_warning >= 1.0:
-                        print(f"Not enough minerals for {building_type}! Need {cost}, have {current}")
-                        self._last_mineral_warning = world.game_time
-                # Cancel the build attempt - worker goes idle
+        if self._build_timers[entity.id] >= build_time:
+            # Construction complete! Spend minerals first (already checked above)
+            if not world.spend_minerals(entity.team, cost):
+                # Minerals were spent elsewhere during build - cancel
                 entity.build_target = None
-                continue
+                del self._build_timers[entity.id]
+                return
 
-            # Progress building timer
-            if entity.id not in self._build_timers:
-                self._build_timers[entity.id] = 0.0
+            # Create building
+            new_id = world.get_next_id()
+            new_building = Barracks(new_id, entity.team, (int(bx), int(by)))
+            world.add_entity(new_building)
 
-            self._build_timers[entity.id] += dt
-            build_time = BUILDING_STATS[building_type]["build_time"]
+            # Publish event
+            event_bus.publish(SpawnEvent(
+                kind=building_type,
+                entity_id=new_id,
+                team=entity.team,
+                pos=(int(bx), int(by))
+            ))
 
-            if self._build_timers[entity.id] >= build_time:
-                # Construction complete! Spend minerals first (already checked above)
-                if not world.spend_minerals(entity.team, cost):
-                    # Minerals were spent elsewhere during build - cancel
-                    entity.build_target = None
-                    del self._build_timers[entity.id]
-                    continue
+            # Clear build task
+            entity.build_target = None
+            del self._build_timers[entity.id]
 
-                # Create building
-                new_id = world.get_next_id()
-                new_building = Barracks(new_id, entity.team, (int(bx), int(by)))
-                world.add_entity(new_building)
 
-                # Publish event
-                event_bus.publish(SpawnEvent(
-                    kind=building_type,
-                    entity_id=new_id,
-                    team=entity.team,
-                    pos=(int(bx), int(by))
-                ))
+class WorkerPass:
+    """Runs ResourceSystem and BuildingPlacementSystem in one pass over the workers.
 
-                # Clear build task
-                entity.build_target = None
-                del self._build_timers[entity.id]
+    Both systems only look at workers, so instead of walking the workers
+    twice per tick each worker is gathered for and then built with.
+    """
+
+    def __init__(self, resources: ResourceSystem, building: BuildingPlacementSystem):
+        self.resources = resources
+        self.building = building
+
+    def update(self, world: 'World', dt: float) -> None:
+        if not self.building.remove_stale_timers(world):
+            return
+
+        update_resources = self.resources.update_worker
+        update_building = self.building.update_worker
+        for entity in world.iter_kind(EntityKind.WORKER):
+            if entity.alive:
+                update_resources(world, entity, dt)
+                update_building(world, entity, dt)
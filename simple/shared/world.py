@@ -2,16 +2,19 @@
 World State
 Central container for all game state.
 """
+import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple, TYPE_CHECKING
+import numpy as np
 from .map_loader import GameMap, load_map, MineralPatch
-from .config import TEAM_PLAYER, TEAM_AI, load_scenario
+from .config import TEAM_PLAYER, TEAM_AI, SCENARIO, SPATIAL_CELL_SIZE
+from .kinds import EntityKind, UNIT_KINDS, BUILDING_KINDS, entity_kind
 
 if TYPE_CHECKING:
     from ..live.entities import Entity, Building
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamState:
     """State for one team (player or AI)"""
     team_id: int
@@ -20,6 +23,76 @@ class TeamState:
     color: str = "#FFFFFF"
 
 
+class SpatialGrid:
+    """Uniform grid that buckets entity ids by cell for proximity queries.
+
+    Instead of checking every entity, a query only looks at the few cells
+    that overlap the search area.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._entity_cell: Dict[int, Tuple[int, int]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self) -> None:
+        """Remove all entities from the grid"""
+        self.cells.clear()
+        self._entity_cell.clear()
+
+    def insert(self, entity_id: int, x: float, y: float) -> None:
+        """Add (or move) an entity"""
+        self.remove(entity_id)
+        cell = self._cell(x, y)
+        self.cells.setdefault(cell, set()).add(entity_id)
+        self._entity_cell[entity_id] = cell
+
+    def remove(self, entity_id: int) -> None:
+        """Remove an entity, if present"""
+        cell = self._entity_cell.pop(entity_id, None)
+        if cell is not None:
+            bucket = self.cells[cell]
+            bucket.discard(entity_id)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, x: float, y: float, radius: float) -> Iterator[int]:
+        """Yield ids of entities in all cells overlapping the square around (x, y)"""
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+
+class EntityTable:
+    """Hot entity fields as parallel NumPy arrays (Structure of Arrays).
+
+    Row i describes entities[i]. The entity objects stay the source of
+    truth (they are live-coded), the table is a snapshot of them that
+    lets systems and queries work on whole arrays at once.
+    """
+
+    def __init__(self, entities: List[Any]):
+        n = len(entities)
+        self.entities = entities  # row -> entity
+        self.row: Dict[int, int] = {e.id: i for i, e in enumerate(entities)}  # entity_id -> row
+        self.ids = np.fromiter((e.id for e in entities), dtype=np.int64, count=n)
+        self.team = np.fromiter((e.team for e in entities), dtype=np.int8, count=n)
+        self.kind = np.fromiter((entity_kind(e) for e in entities), dtype=np.int8, count=n)
+        self.alive = np.fromiter((e.alive for e in entities), dtype=bool, count=n)
+        self.x = np.fromiter((e.x for e in entities), dtype=np.float64, count=n)
+        self.y = np.fromiter((e.y for e in entities), dtype=np.float64, count=n)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
 @dataclass
 class World:
     """Complete game world state"""
@@ -31,9 +104,27 @@ class World:
     game_over: bool = False
     winner: Optional[int] = None
 
+    # team -> {entity_id: entity}, kept in sync by add_entity/remove_entity
+    # (insertion ordered, so per-team iteration matches the entities dict)
+    entities_by_team: Dict[int, Dict[int, Any]] = field(default_factory=dict, repr=False)
+
+    # (team, kind) -> {entity_id: entity}, same idea, see get_team_kind()
+    _by_team_kind: Dict[Tuple[int, EntityKind], Dict[int, Any]] = field(default_factory=dict, repr=False)
+
+    # kind -> {entity_id: entity} over all teams, see iter_kind()
+    _by_kind: Dict[EntityKind, Dict[int, Any]] = field(default_factory=dict, repr=False)
+
+    # SoA snapshot of all entities, see get_entity_table()
+    _table: Optional[EntityTable] = field(default=None, repr=False)
+    _table_time: float = field(default=-1.0, repr=False)
+
+    # Spatial grid of all entities, see get_spatial_grid()
+    _grid: SpatialGrid = field(default_factory=lambda: SpatialGrid(SPATIAL_CELL_SIZE), repr=False)
+    _grid_time: float = field(default=-1.0, repr=False)
+
     def __post_init__(self):
         """Initialize teams and minerals from scenario"""
-        scenario = load_scenario()
+        scenario = SCENARIO
 
         # Initialize teams
         for team_id_str, team_data in scenario.get("teams", {}).items():
@@ -54,7 +145,7 @@ class World:
                 continue
             amount = mineral_data.get("amount", 1500)
             mineral = MineralPatch(x=int(pos[0]), y=int(pos[1]), remaining=amount)
-            self.game_map.minerals.append(mineral)
+            self.game_map.add_mineral(mineral)
 
     def get_next_id(self) -> int:
         """Generate a unique entity ID"""
@@ -65,11 +156,23 @@ class World:
     def add_entity(self, entity: Any) -> None:
         """Add an entity to the world"""
         self.entities[entity.id] = entity
+        self.entities_by_team.setdefault(entity.team, {})[entity.id] = entity
+        kind = entity_kind(entity)
+        self._by_team_kind.setdefault((entity.team, kind), {})[entity.id] = entity
+        self._by_kind.setdefault(kind, {})[entity.id] = entity
+        self._table = None
+        self._grid.insert(entity.id, entity.x, entity.y)
 
     def remove_entity(self, entity_id: int) -> None:
         """Remove an entity from the world"""
-        if entity_id in self.entities:
-            del self.entities[entity_id]
+        entity = self.entities.pop(entity_id, None)
+        if entity is not None:
+            self.entities_by_team[entity.team].pop(entity_id, None)
+            kind = entity_kind(entity)
+            self._by_team_kind[(entity.team, kind)].pop(entity_id, None)
+            self._by_kind[kind].pop(entity_id, None)
+            self._table = None
+            self._grid.remove(entity_id)
 
     def get_entity(self, entity_id: int) -> Optional[Any]:
         """Get entity by ID"""
@@ -77,69 +180,157 @@ class World:
 
     def get_entities_by_team(self, team: int) -> List[Any]:
         """Get all entities belonging to a team"""
-        return [e for e in self.entities.values() if e.team == team]
+        return list(self._team_entities(team))
+
+    def _team_entities(self, team: int) -> Iterator[Any]:
+        """Iterate a team's entities without scanning all entities"""
+        return iter(self.entities_by_team.get(team, {}).values())
+
+    def _enemy_entities(self, team: int) -> Iterator[Any]:
+        """Iterate the entities of all other teams"""
+        for other_team, members in self.entities_by_team.items():
+            if other_team != team:
+                yield from members.values()
+
+    def mark_moved(self) -> None:
+        """Note that entities moved, so the grid and table are rebuilt on next use.
+
+        The MovementSystem calls this. Code that moves entities elsewhere
+        must call it before the next query in the same tick.
+        """
+        self._grid_time = -1.0
+        self._table = None
+
+    def get_spatial_grid(self) -> SpatialGrid:
+        """Get a spatial grid of all entities.
+
+        Units move every tick, so the grid is rebuilt once per simulation
+        tick on first use (or after mark_moved()). Entities added or
+        removed in between are updated directly.
+        """
+        if self._grid_time != self.game_time:
+            self._grid.clear()
+            for e in self.entities.values():
+                self._grid.insert(e.id, e.x, e.y)
+            self._grid_time = self.game_time
+        return self._grid
+
+    def get_entity_table(self) -> EntityTable:
+        """Get the hot fields of all entities as NumPy arrays.
+
+        Built once per simulation tick on first use (or after entities
+        were added, removed or moved), like the spatial grid.
+        """
+        if self._table is None or self._table_time != self.game_time:
+            self._table = EntityTable(list(self.entities.values()))
+            self._table_time = self.game_time
+        return self._table
+
+    def has_kind(self, *kinds: EntityKind) -> bool:
+        """Check if any entity of the given kinds exists (all teams)"""
+        return any(self._by_kind.get(kind) for kind in kinds)
+
+    def iter_kind(self, *kinds: EntityKind) -> Iterator[Any]:
+        """Iterate all entities of the given kinds (all teams).
+
+        Iterates the live index: snapshot it (tuple(...)) if entities of
+        these kinds may be removed or added while looping.
+        """
+        for kind in kinds:
+            yield from self._by_kind.get(kind, {}).values()
+
+    def get_team_kind(self, team: int, kind: EntityKind) -> List[Any]:
+        """Get all entities of one kind for a team (e.g. the AI's workers)"""
+        return list(self._by_team_kind.get((team, kind), {}).values())
 
     def get_units_by_team(self, team: int) -> List[Any]:
-        """Get all units (not buildings) for a team"""
-        from ..live.entities import Unit
-        return [e for e in self.entities.values()
-                if e.team == team and isinstance(e, Unit)]
+        """Get all units (not buildings) for a team, grouped by kind"""
+        units = []
+        for kind in UNIT_KINDS:
+            units.extend(self._by_team_kind.get((team, kind), {}).values())
+        return units
 
     def get_buildings_by_team(self, team: int) -> List[Any]:
-        """Get all buildings for a team"""
-        from ..live.entities import Building
-        return [e for e in self.entities.values()
-                if e.team == team and isinstance(e, Building)]
+        """Get all buildings for a team, grouped by kind"""
+        buildings = []
+        for kind in BUILDING_KINDS:
+            buildings.extend(self._by_team_kind.get((team, kind), {}).values())
+        return buildings
 
     def get_base(self, team: int) -> Optional[Any]:
         """Get the main base for a team"""
-        from ..live.entities import Base
-        for e in self.entities.values():
-            if e.team == team and isinstance(e, Base):
-                return e
-        return None
+        bases = self._by_team_kind.get((team, EntityKind.BASE))
+        return next(iter(bases.values()), None) if bases else None
+
+    def _nearby_enemies(self, entity: Any, radius: float) -> Iterator[Any]:
+        """Iterate living enemies in the grid cells around an entity.
+
+        Only narrows the search down, callers still check the distance.
+        """
+        entities = self.entities
+        team = entity.team
+        for other_id in self.get_spatial_grid().query(entity.x, entity.y, radius):
+            other = entities[other_id]
+            if other.team != team and other.alive:
+                yield other
 
     def get_enemies_in_range(self, entity: Any, range_: float) -> List[Any]:
         """Get all enemy entities within range"""
         enemies = []
-        for other in self.entities.values():
-            if other.team != entity.team and other.alive:
-                dx = other.x - entity.x
-                dy = other.y - entity.y
-                dist = (dx * dx + dy * dy) ** 0.5
-                if dist <= range_:
-                    enemies.append(other)
+        range_sq = range_ * range_
+        for other in self._nearby_enemies(entity, range_):
+            dx = other.x - entity.x
+            dy = other.y - entity.y
+            if dx * dx + dy * dy <= range_sq:
+                enemies.append(other)
+        enemies.sort(key=lambda e: e.id)  # Oldest first, independent of grid layout
         return enemies
 
     def get_nearest_enemy(self, entity: Any, max_range: float = float('inf')) -> Optional[Any]:
         """Get nearest enemy entity"""
+        if max_range == float('inf'):
+            # Unbounded search would cover the whole grid, compare all at once
+            table = self.get_entity_table()
+            if not len(table):
+                return None
+            dx = table.x - entity.x
+            dy = table.y - entity.y
+            dist_sq = dx * dx + dy * dy
+            dist_sq[(table.team == entity.team) | ~table.alive] = np.inf
+            i = int(dist_sq.argmin())  # First minimum, i.e. the oldest on ties
+            return table.entities[i] if dist_sq[i] < np.inf else None
+
         best = None
-        best_dist = max_range
-        for other in self.entities.values():
-            if other.team != entity.team and other.alive:
-                dx = other.x - entity.x
-                dy = other.y - entity.y
-                dist = (dx * dx + dy * dy) ** 0.5
-                if dist < best_dist:
-                    best_dist = dist
-                    best = other
+        best_dist_sq = max_range * max_range
+        for other in self._nearby_enemies(entity, max_range):
+            dx = other.x - entity.x
+            dy = other.y - entity.y
+            dist_sq = dx * dx + dy * dy
+            # Ties go to the oldest entity, independent of grid layout
+            if dist_sq < best_dist_sq or (dist_sq == best_dist_sq and best is not None
+                                          and other.id < best.id):
+                best_dist_sq = dist_sq
+                best = other
         return best
 
     def add_minerals(self, team: int, amount: int) -> None:
         """Add minerals to a team's stockpile"""
-        if team in self.teams:
-            self.teams[team].minerals += amount
+        team_state = self.teams.get(team)  # One lookup, not one per access
+        if team_state is not None:
+            team_state.minerals += amount
 
     def spend_minerals(self, team: int, amount: int) -> bool:
         """Try to spend minerals, return True if successful"""
-        if team in self.teams and self.teams[team].minerals >= amount:
-            self.teams[team].minerals -= amount
+        team_state = self.teams.get(team)
+        if team_state is not None and team_state.minerals >= amount:
+            team_state.minerals -= amount
             return True
         return False
 
     def get_minerals(self, team: int) -> int:
         """Get mineral count for team"""
-        return self.teams.get(team, TeamState(team)).minerals
+        team_state = self.teams.get(team)
+        return team_state.minerals if team_state is not None else 0
 
     def check_victory(self) -> None:
         """Check if game is over (one team's base is destroyed)"""
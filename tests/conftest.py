@@ -1,4 +1,7 @@
 """Pytest fixtures for MicroCraft tests."""
+import copy
+import pickle
+import sys
 import pytest
 from pathlib import Path
 
@@ -6,48 +9,135 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_numba():
+    """Compile the Numba kernels once before the first test (no-op without Numba).
+
+    The kernels use cache=True, so later sessions load them from __pycache__.
+    """
+    import numpy as np
+    from full.core import _hot as full_hot
+    from simple.shared import _hot as simple_hot
+
+    if full_hot.njit is not None:
+        full_hot.find_path_kernel(np.zeros((2, 2), dtype=np.int8), 0, 0, 1, 1,
+                                  np.array([1], dtype=np.int32), np.array([1], dtype=np.int32),
+                                  np.array([1.414]), np.full(4, -1.0))
+    if simple_hot.njit is not None:
+        one = np.zeros(1)
+        simple_hot.apply_movement(one, one.copy(), one.copy(), one.copy(), one.copy())
+
+
 @pytest.fixture
 def project_root():
     """Return the project root path."""
     return PROJECT_ROOT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_dir():
     """Return the data directory path."""
     return PROJECT_ROOT / "data"
 
 
-@pytest.fixture
-def world(data_dir):
-    """Create a World with map and scenario loaded."""
+@pytest.fixture(scope="session")
+def _proto_empty_world(data_dir):
+    """World with only the map loaded, parsed once per session (copy it, don't use it)."""
     from full.core.world import World
     w = World()
     w.load_map(data_dir / "map.csv")
+    return w
+
+
+@pytest.fixture(scope="session")
+def _proto_world(_proto_empty_world, data_dir):
+    """World with map and scenario loaded, parsed once per session (copy it, don't use it)."""
+    w = copy.deepcopy(_proto_empty_world)
     w.load_scenario(data_dir / "scenario.json")
     return w
 
 
 @pytest.fixture
-def empty_world(data_dir):
-    """Create a World with only the map loaded (no entities)."""
-    from full.core.world import World
-    w = World()
-    w.load_map(data_dir / "map.csv")
-    return w
+def world(_proto_world):
+    """Create a World with map and scenario loaded."""
+    return copy.deepcopy(_proto_world)
 
 
 @pytest.fixture
-def pathfinder(empty_world):
-    """Create a PathFinder with the game map."""
+def empty_world(_proto_empty_world):
+    """Create a World with only the map loaded (no entities)."""
+    return copy.deepcopy(_proto_empty_world)
+
+
+@pytest.fixture(scope="session")
+def pathfinder(_proto_empty_world):
+    """PathFinder on the session's game map (find_path keeps no state between calls)."""
     from full.core.systems import PathFinder
-    return PathFinder(empty_world.game_map)
+    return PathFinder(_proto_empty_world.game_map)
+
+
+@pytest.fixture(scope="session")
+def _proto_game_world():
+    """Pickled World of a set up full Game, built once per session."""
+    from full.main import Game
+    g = Game()
+    g.setup()
+    return pickle.dumps(g.world)
 
 
 @pytest.fixture
-def game():
+def game(_proto_game_world):
     """Create a full Game instance (without renderer)."""
     from full.main import Game
+    from full.core.systems import (
+        MovementSystem, CombatSystem, ResourceSystem, ProductionSystem,
+        BuildingPlacementSystem, FogOfWarSystem, AISystem,
+    )
     g = Game()
-    g.setup()
+    # Swap in a copy of the set up world instead of running setup() again,
+    # and rebuild the systems on it (like Game.reset() does)
+    g.world = pickle.loads(_proto_game_world)
+    g.movement = MovementSystem(g.world)
+    g.combat = CombatSystem(g.world)
+    g.resources = ResourceSystem(g.world)
+    g.production = ProductionSystem(g.world)
+    g.building = BuildingPlacementSystem(g.world)
+    g.fog = FogOfWarSystem(g.world)
+    g.ai = AISystem(g.world, team=2, debug=g.debug)
+    g.attack_handler.set_world(g.world)
     return g
+
+
+@pytest.fixture
+def event_bus():
+    """Create an EventBus of its own (the global one outlives the test)."""
+    from full.core.events import EventBus
+    bus = EventBus()
+    yield bus
+    bus.clear()
+
+
+@pytest.fixture
+def ref_entities(monkeypatch):
+    """Use simple/ref entities in place of the live-coded ones (like --use-ref)."""
+    from simple import live, ref
+    monkeypatch.setattr(live, "entities", ref.entities, raising=False)
+    monkeypatch.setitem(sys.modules, "simple.live.entities", ref.entities)
+    return ref.entities
+
+
+@pytest.fixture
+def ref_events(monkeypatch):
+    """Use simple/ref events with a fresh EventBus in place of the live-coded ones."""
+    from simple import live, ref
+    monkeypatch.setattr(ref.events, "event_bus", ref.events.EventBus())
+    monkeypatch.setattr(live, "events", ref.events, raising=False)
+    monkeypatch.setitem(sys.modules, "simple.live.events", ref.events)
+    return ref.events
+
+
+@pytest.fixture
+def simple_world(ref_entities):
+    """Create a simple World with no entities."""
+    from simple.shared.world import World
+    return World()
@@ -1,5 +1,6 @@
 """Integration tests for the full game."""
 import pytest
+from full.core.entities import Worker, Base
 
 
 class TestGameIntegration:
@@ -33,13 +34,10 @@ class TestGameIntegration:
 
     def test_game_build_mode(self, game):
         """Build mode should activate for workers."""
-        from full.core.entities import Worker
-
         # Find and select a worker
-        for e in game.world.entities.values():
-            if isinstance(e, Worker) and e.team == 1:
-                game.selection.select_single(e.id)
-                break
+        worker = game.world.first_of(Worker, team=1)
+        if worker:
+            game.selection.select_single(worker.id)
 
         # Enter build mode
         game.start_build_mode("Barracks")
@@ -53,25 +51,18 @@ class TestGameIntegration:
 
     def test_game_production_request(self, game):
         """Production request should work for buildings."""
-        from full.core.entities import Base
-
         # Find and select a base
-        for e in game.world.entities.values():
-            if isinstance(e, Base) and e.team == 1:
-                game.selection.select_single(e.id)
-                game.request_production()
-                # Check queue
-                assert len(e.production_queue) > 0 or game.world.team_minerals[1] < 50
-                break
+        base = game.world.first_of(Base, team=1)
+        if base:
+            game.selection.select_single(base.id)
+            game.request_production()
+            # Check queue
+            assert len(base.production_queue) > 0 or game.world.team_minerals[1] < 50
 
     def test_game_selection(self, game):
         """Clicking on entity should select it."""
         # Get first player entity
-        player_entity = None
-        for e in game.world.entities.values():
-            if e.team == 1:
-                player_entity = e
-                break
+        player_entity = next(iter(game.world.get_entities_by_team(1)), None)
 
         if player_entity:
             game.handle_click(player_entity.x, player_entity.y)
@@ -88,13 +79,10 @@ class TestVictoryConditions:
 
     def test_player_wins_when_ai_base_destroyed(self, game):
         """Player wins when AI base is destroyed."""
-        from full.core.entities import Base
-
         # Find AI base and destroy it
-        for e in list(game.world.entities.values()):
-            if isinstance(e, Base) and e.team == 2:
-                e.take_damage(e.hp + 100)
-                break
+        base = game.world.first_of(Base, team=2)
+        if base:
+            game.world.force_kill(base.id)
 
         game.world.check_victory()
         # Check victory is detected
@@ -103,13 +91,10 @@ class TestVictoryConditions:
 
     def test_player_loses_when_base_destroyed(self, game):
         """Player loses when their base is destroyed."""
-        from full.core.entities import Base
-
         # Find player base and destroy it
-        for e in list(game.world.entities.values()):
-            if isinstance(e, Base) and e.team == 1:
-                e.take_damage(e.hp + 100)
-                break
+        base = game.world.first_of(Base, team=1)
+        if base:
+            game.world.force_kill(base.id)
 
         game.world.check_victory()
         # Check defeat is detected
@@ -125,9 +110,9 @@ class TestEvents:
         from full.core.events import event_bus
         assert event_bus is not None
 
-    def test_event_subscription(self):
+    def test_event_subscription(self, event_bus):
         """Event subscription should work."""
-        from full.core.events import event_bus, DeathEvent
+        from full.core.events import DeathEvent
 
         received_events = []
 
@@ -142,3 +127,24 @@ class TestEvents:
 
         assert len(received_events) == 1
         assert received_events[0].entity_id == 1
+
+    def test_has_subscribers(self, event_bus):
+        """has_subscribers reflects subscribe/unsubscribe."""
+        from full.core.events import SpawnEvent
+
+        def handler(event):
+            pass
+
+        assert not event_bus.has_subscribers(SpawnEvent)
+        event_bus.subscribe(SpawnEvent, handler)
+        assert event_bus.has_subscribers(SpawnEvent)
+        event_bus.unsubscribe(SpawnEvent, handler)
+        assert not event_bus.has_subscribers(SpawnEvent)
+
+    def test_recording_counts_as_subscriber(self, event_bus):
+        """Skipped publishes would be missing from a recording."""
+        from full.core.events import AttackEvent
+        event_bus.start_recording()
+        assert event_bus.has_subscribers(AttackEvent)
+        event_bus.stop_recording()
+        assert not event_bus.has_subscribers(AttackEvent)
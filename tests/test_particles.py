@@ -0,0 +1,79 @@
+"""Test the simple version's particle system."""
+import numpy as np
+import pytest
+from simple.shared import particle_system
+from simple.shared.particle_system import ParticleSystem
+
+
+class TestParticleSystem:
+    """Tests for the SoA ParticleSystem."""
+
+    def test_spawn_adds_particle(self):
+        ps = ParticleSystem()
+        ps.spawn(1.0, 2.0, angle=0, speed=10, color="#FF0000", lifetime=1.0)
+        particles = list(ps.get_particles())
+        assert len(particles) == 1
+        assert particles[0].x == 1.0
+        assert particles[0].color == "#FF0000"
+
+    def test_update_moves_and_culls(self):
+        ps = ParticleSystem()
+        ps.spawn(0.0, 0.0, angle=0, speed=10, color="#FF0000", lifetime=0.5)
+        ps.spawn(0.0, 0.0, angle=0, speed=10, color="#00FF00", lifetime=2.0)
+        ps.update(0.1)
+        assert ps.get_particles().x[0] > 0.0
+        ps.update(0.5)
+        particles = list(ps.get_particles())
+        assert len(particles) == 1
+        assert particles[0].color == "#00FF00"
+
+    def test_max_particles_respected(self):
+        ps = ParticleSystem(max_particles=20)
+        ps.spawn_burst(0.0, 0.0, count=50, min_speed=10, max_speed=20,
+                       colors=["#FFFFFF"], min_lifetime=1.0, max_lifetime=2.0)
+        assert len(ps.get_particles()) == 20
+
+    def test_clear(self):
+        ps = ParticleSystem()
+        ps.spawn(0.0, 0.0, angle=0, speed=10, color="#FF0000", lifetime=1.0)
+        ps.clear()
+        assert len(ps.get_particles()) == 0
+        assert ps.palette == []
+
+    def test_palette_drops_unused_colors(self):
+        ps = ParticleSystem(max_particles=4)
+        for i in range(ParticleSystem.MAX_PALETTE * 2):
+            ps.spawn(0.0, 0.0, angle=0, speed=0, color=f"#{i:06X}", lifetime=10.0)
+
+        assert len(ps.palette) <= ParticleSystem.MAX_PALETTE
+        last = [f"#{i:06X}" for i in range(ParticleSystem.MAX_PALETTE * 2 - 4, ParticleSystem.MAX_PALETTE * 2)]
+        assert sorted(p.color for p in ps.get_particles()) == last
+
+    def test_overflow_after_wrap_evicts_oldest(self):
+        ps = ParticleSystem(max_particles=4)
+        for color in ("A", "B", "C", "D", "E"):  # E overwrites A
+            lifetime = 0.05 if color == "C" else 10.0
+            ps.spawn(0.0, 0.0, angle=0, speed=0, color=color, lifetime=lifetime)
+        ps.update(0.1)  # C dies, B is now the oldest
+        ps.spawn(0.0, 0.0, angle=0, speed=0, color="F", lifetime=10.0)
+        ps.spawn(0.0, 0.0, angle=0, speed=0, color="G", lifetime=10.0)  # Overwrites B
+
+        assert sorted(p.color for p in ps.get_particles()) == ["D", "E", "F", "G"]
+
+    def test_update_kernels_agree(self):
+        # The Numba loop (run interpreted here) and the NumPy version must match
+        rng = np.random.default_rng(0)
+        n = 50
+        fields = [rng.uniform(-10, 10, n).astype(np.float32) for _ in range(4)]
+        lifetime = rng.uniform(-0.05, 0.2, n).astype(np.float32)  # Some die this update
+        rest = [lifetime, lifetime.copy(), rng.uniform(2, 5, n).astype(np.float32),
+                np.arange(n, dtype=np.int16)]
+
+        arrays1 = [a.copy() for a in fields + rest]
+        count1 = particle_system._update_numpy(*arrays1, 0.1, n)
+        arrays2 = [a.copy() for a in fields + rest]
+        count2 = particle_system._update_loop(*arrays2, 0.1, n)
+
+        assert 0 < count1 == count2 < n
+        for a1, a2 in zip(arrays1, arrays2):
+            assert np.allclose(a1[:count1], a2[:count2])
@@ -1,4 +1,5 @@
 """Test A* pathfinding."""
+import numpy as np
 import pytest
 
 
@@ -12,15 +13,12 @@ class TestPathFinder:
         # Should reach the goal
         assert path[-1] == (10, 5)
 
-    def test_path_avoids_walls(self, pathfinder, empty_world):
+    def test_path_avoids_walls(self, pathfinder):
         """Path should go around walls, not through them."""
         # Find a wall on the map
-        game_map = empty_world.game_map
-        wall_positions = []
-        for y in range(game_map.height):
-            for x in range(game_map.width):
-                if game_map.tiles[y][x] == 1:  # Wall
-                    wall_positions.append((x, y))
+        game_map = pathfinder.game_map
+        wall_ys, wall_xs = np.nonzero(np.asarray(game_map.tiles) == 1)  # Walls
+        wall_positions = list(zip(wall_xs.tolist(), wall_ys.tolist()))
 
         if wall_positions:
             # Find path that would cross a wall area
@@ -60,3 +58,20 @@ class TestPathFinder:
         assert pf.game_map is not None
         assert pf.game_map.width > 0
         assert pf.game_map.height > 0
+
+    def test_kernel_matches_python_search(self, pathfinder):
+        """The Numba A* loop (run interpreted here) finds the same paths."""
+        import random
+        from full.core import _hot
+        game_map = pathfinder.game_map
+        rng = random.Random(0)
+        for _ in range(50):
+            start = (rng.randrange(game_map.width), rng.randrange(game_map.height))
+            goal = (rng.randrange(game_map.width), rng.randrange(game_map.height))
+            if start == goal or not game_map.is_walkable(*goal):
+                continue
+            h_cache = np.full(game_map.width * game_map.height, -1.0)
+            kernel_path = _hot._find_path_loop(
+                game_map.tile_array(), start[0], start[1], goal[0], goal[1],
+                pathfinder._dir_x, pathfinder._dir_y, pathfinder._dir_cost, h_cache)
+            assert [tuple(p) for p in kernel_path.tolist()] == pathfinder._search(start, goal)
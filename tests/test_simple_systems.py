@@ -0,0 +1,160 @@
+"""Test the simple version's game systems (with the reference entities)."""
+import pytest
+
+
+class TestMovementSystem:
+    """Tests for the vectorized MovementSystem."""
+
+    def test_unit_moves_toward_destination(self, simple_world, ref_entities):
+        from simple.shared.systems import MovementSystem
+        worker = ref_entities.Worker(1, 1, (0.0, 0.0))
+        worker.destination = (10.0, 0.0)
+        simple_world.add_entity(worker)
+
+        MovementSystem().update(simple_world, 1.0)
+        assert worker.x == pytest.approx(worker.speed)
+        assert worker.y == pytest.approx(0.0)
+        assert worker.destination == (10.0, 0.0)
+
+    def test_unit_arrives_and_stops(self, simple_world, ref_entities):
+        from simple.shared.systems import MovementSystem
+        near = ref_entities.Worker(1, 1, (0.0, 0.0))
+        near.destination = (0.5, 0.5)
+        there = ref_entities.Worker(2, 1, (3.0, 3.0))
+        there.destination = (3.05, 3.0)
+        for e in (near, there):
+            simple_world.add_entity(e)
+
+        MovementSystem().update(simple_world, 1.0)
+        assert (near.x, near.y) == (0.5, 0.5)
+        assert near.destination is None
+        assert (there.x, there.y) == (3.0, 3.0)  # Close enough, does not move
+        assert there.destination is None
+
+    def test_movement_kernels_agree(self):
+        # The Numba loop (run interpreted here) and the NumPy version must match
+        import numpy as np
+        from simple.shared import _hot
+        rng = np.random.default_rng(0)
+        x, y = rng.uniform(0, 10, 50), rng.uniform(0, 10, 50)
+        dest_x, dest_y = x + rng.uniform(-1, 1, 50), y + rng.uniform(-1, 1, 50)
+        move_dist = rng.uniform(0, 1, 50)
+
+        x1, y1 = x.copy(), y.copy()
+        state1 = _hot._apply_movement_numpy(x1, y1, dest_x, dest_y, move_dist)
+        x2, y2 = x.copy(), y.copy()
+        state2 = np.empty(50, dtype=np.int8)
+        _hot._apply_movement_loop(x2, y2, dest_x, dest_y, move_dist, state2)
+
+        assert (state1 == state2).all()
+        assert np.allclose(x1, x2) and np.allclose(y1, y2)
+
+
+class TestCombatSystem:
+    """Tests for the simple CombatSystem."""
+
+    def test_attack_events_only_built_when_heard(self, simple_world, ref_entities, ref_events):
+        from simple.shared.systems import CombatSystem
+        events = ref_events
+        bus = events.event_bus
+
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        enemy = ref_entities.Worker(2, 2, (11.0, 10.0))
+        simple_world.add_entity(soldier)
+        simple_world.add_entity(enemy)
+        assert not bus.has_subscribers(events.AttackEvent)
+
+        CombatSystem().update(simple_world, 0.1)
+        assert enemy.hp < enemy.max_hp
+
+        heard = []
+        bus.subscribe(events.AttackEvent, heard.append)
+        soldier.cooldown = 0
+        CombatSystem().update(simple_world, 0.1)
+        assert [e.target_id for e in heard] == [2]
+
+
+class TestProductionSystem:
+    """Tests for the simple ProductionSystem."""
+
+    def test_only_started_buildings_produce(self, simple_world, ref_entities, ref_events):
+        from simple.shared.systems import ProductionSystem
+        base = ref_entities.Base(simple_world.get_next_id(), 1, (5, 5))
+        idle = ref_entities.Base(simple_world.get_next_id(), 2, (20, 20))
+        simple_world.add_entity(base)
+        simple_world.add_entity(idle)
+        base.start_production()
+
+        production = ProductionSystem()
+        production.update(simple_world, 1.0)
+        assert idle.production_progress == 0.0
+        assert 0.0 < base.production_progress < 1.0
+
+        production.update(simple_world, 10.0)
+        assert base.current_production is None
+        assert [type(e).__name__ for e in simple_world.entities.values()] == ["Base", "Base", "Worker"]
+
+    def test_buildings_finish_in_id_order(self, simple_world, ref_entities, ref_events):
+        from simple.shared.systems import ProductionSystem
+        barracks = ref_entities.Barracks(simple_world.get_next_id(), 1, (5, 5))
+        base = ref_entities.Base(simple_world.get_next_id(), 1, (20, 20))
+        simple_world.add_entity(barracks)
+        simple_world.add_entity(base)
+        barracks.start_production()
+        base.start_production()
+
+        # Both finish in one tick; the lower id spawns (and takes an id) first
+        ProductionSystem().update(simple_world, 30.0)
+        assert [type(e).__name__ for e in simple_world.entities.values()] == ["Barracks", "Base", "Soldier", "Worker"]
+
+
+class TestResourceSystem:
+    """Tests for the simple ResourceSystem."""
+
+    def test_harvest_takes_gather_time(self, simple_world, ref_entities, ref_events):
+        from simple.shared.config import MINERAL_GATHER_TIME, SIM_HZ
+        from simple.shared.map_loader import MineralPatch
+        from simple.shared.systems import ResourceSystem
+        mineral = MineralPatch(10, 10, remaining=100)
+        worker = ref_entities.Worker(simple_world.get_next_id(), 1, (10.5, 10.0))
+        worker.gather_target = mineral
+        simple_world.add_entity(worker)
+
+        resources = ResourceSystem()
+        dt = 1.0 / SIM_HZ
+        ticks = 0
+        while worker.carrying == 0:
+            simple_world.game_time += dt
+            resources.update(simple_world, dt)
+            ticks += 1
+        assert ticks == round(MINERAL_GATHER_TIME * SIM_HZ)
+        assert resources.gather_timers == {}
+
+    def test_harvest_resumes_after_leaving_range(self, simple_world, ref_entities, ref_events):
+        from simple.shared.config import MINERAL_GATHER_TIME, SIM_HZ
+        from simple.shared.map_loader import MineralPatch
+        from simple.shared.systems import ResourceSystem
+        mineral = MineralPatch(10, 10, remaining=100)
+        worker = ref_entities.Worker(simple_world.get_next_id(), 1, (10.5, 10.0))
+        worker.gather_target = mineral
+        simple_world.add_entity(worker)
+
+        resources = ResourceSystem()
+        dt = 1.0 / SIM_HZ
+        full_harvest = round(MINERAL_GATHER_TIME * SIM_HZ)
+
+        def run(ticks):
+            for _ in range(ticks):
+                simple_world.game_time += dt
+                resources.update(simple_world, dt)
+
+        run(full_harvest - 5)
+        worker.x = 20.0  # Leaves range for a while
+        run(10)
+        assert worker.id in resources.gather_timers
+
+        worker.x = 10.5
+        run(4)
+        assert worker.carrying == 0
+        run(1)
+        assert worker.carrying > 0
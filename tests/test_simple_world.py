@@ -0,0 +1,158 @@
+"""Test the simple version's World queries (with the reference entities)."""
+import pytest
+
+
+class TestEnemyQueries:
+    """Tests for World.get_nearest_enemy / get_enemies_in_range."""
+
+    def test_nearest_enemy_in_range(self, simple_world, ref_entities):
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        near = ref_entities.Worker(2, 2, (12.0, 10.0))
+        far = ref_entities.Worker(3, 2, (13.5, 10.0))
+        friend = ref_entities.Worker(4, 1, (10.5, 10.0))
+        for e in (soldier, near, far, friend):
+            simple_world.add_entity(e)
+
+        assert simple_world.get_nearest_enemy(soldier, 4.0) is near
+        assert simple_world.get_nearest_enemy(soldier, 1.0) is None
+        assert simple_world.get_nearest_enemy(soldier) is near
+
+    def test_enemies_in_range(self, simple_world, ref_entities):
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        simple_world.add_entity(soldier)
+        for i, x in enumerate((11.0, 13.9, 14.1, 30.0)):
+            simple_world.add_entity(ref_entities.Worker(10 + i, 2, (x, 10.0)))
+
+        found = simple_world.get_enemies_in_range(soldier, 4.0)
+        assert [e.id for e in found] == [10, 11]
+
+    def test_removed_enemy_not_found(self, simple_world, ref_entities):
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        enemy = ref_entities.Worker(2, 2, (11.0, 10.0))
+        simple_world.add_entity(soldier)
+        simple_world.add_entity(enemy)
+        assert simple_world.get_nearest_enemy(soldier, 4.0) is enemy
+
+        simple_world.remove_entity(enemy.id)
+        assert simple_world.get_nearest_enemy(soldier, 4.0) is None
+
+    def test_enemies_seen_after_move(self, simple_world, ref_entities):
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        enemy = ref_entities.Worker(2, 2, (40.0, 10.0))
+        simple_world.add_entity(soldier)
+        simple_world.add_entity(enemy)
+        assert simple_world.get_enemies_in_range(soldier, 4.0) == []
+
+        # Moved within the same tick
+        enemy.x = 11.0
+        simple_world.mark_moved()
+        assert simple_world.get_enemies_in_range(soldier, 4.0) == [enemy]
+        assert simple_world.get_nearest_enemy(soldier, 4.0) is enemy
+
+    def test_nearest_enemy_unbounded_skips_friends(self, simple_world, ref_entities):
+        soldier = ref_entities.Soldier(1, 1, (10.0, 10.0))
+        friend = ref_entities.Worker(2, 1, (10.5, 10.0))
+        enemy = ref_entities.Worker(3, 2, (40.0, 10.0))
+        for e in (soldier, friend, enemy):
+            simple_world.add_entity(e)
+
+        assert simple_world.get_nearest_enemy(soldier) is enemy
+        simple_world.remove_entity(enemy.id)
+        assert simple_world.get_nearest_enemy(soldier) is None
+
+
+class TestEntityTable:
+    """Tests for the SoA snapshot World.get_entity_table()."""
+
+    def test_table_matches_entities(self, simple_world, ref_entities):
+        from simple.shared.kinds import EntityKind
+        simple_world.add_entity(ref_entities.Base(1, 1, (5, 5)))
+        simple_world.add_entity(ref_entities.Worker(2, 2, (7.5, 6.0)))
+
+        table = simple_world.get_entity_table()
+        assert len(table) == 2
+        assert list(table.ids) == [1, 2]
+        assert list(table.kind) == [EntityKind.BASE, EntityKind.WORKER]
+        assert table.x[table.row[2]] == 7.5
+
+    def test_table_rebuilt_after_add(self, simple_world, ref_entities):
+        simple_world.add_entity(ref_entities.Worker(1, 1, (1.0, 1.0)))
+        assert len(simple_world.get_entity_table()) == 1
+        simple_world.add_entity(ref_entities.Worker(2, 1, (2.0, 1.0)))
+        assert len(simple_world.get_entity_table()) == 2
+
+
+class TestTeamKindIndex:
+    """Tests for the per-team, per-kind entity index."""
+
+    def test_getters_use_kinds(self, simple_world, ref_entities):
+        from simple.shared.kinds import EntityKind
+        base = ref_entities.Base(1, 2, (5, 5))
+        worker = ref_entities.Worker(2, 2, (6, 6))
+        soldier = ref_entities.Soldier(3, 2, (7, 7))
+        barracks = ref_entities.Barracks(4, 2, (9, 5))
+        other_team = ref_entities.Worker(5, 1, (1, 1))
+        for e in (base, worker, soldier, barracks, other_team):
+            simple_world.add_entity(e)
+
+        assert simple_world.get_base(2) is base
+        assert simple_world.get_team_kind(2, EntityKind.WORKER) == [worker]
+        assert simple_world.get_units_by_team(2) == [worker, soldier]
+        assert simple_world.get_buildings_by_team(2) == [base, barracks]
+
+        simple_world.remove_entity(base.id)
+        assert simple_world.get_base(2) is None
+
+    def test_has_kind(self, simple_world, ref_entities):
+        from simple.shared.kinds import EntityKind
+        assert not simple_world.has_kind(EntityKind.SOLDIER)
+        simple_world.add_entity(ref_entities.Soldier(1, 2, (1, 1)))
+        assert simple_world.has_kind(EntityKind.WORKER, EntityKind.SOLDIER)
+        simple_world.remove_entity(1)
+        assert not simple_world.has_kind(EntityKind.SOLDIER)
+
+
+class TestGameMap:
+    """Tests for the simple GameMap."""
+
+    def test_default_tiles_are_ground(self):
+        from simple.shared.map_loader import GameMap
+        game_map = GameMap(width=3, height=2)
+        assert game_map.tiles.shape == (2, 3)
+        assert game_map.is_walkable(2, 1) and not game_map.is_walkable(3, 1)
+
+    def test_walls_and_minerals_block(self):
+        from simple.shared.map_loader import GameMap
+        game_map = GameMap(width=3, height=1, tiles=[[0, 1, 2]])
+        assert [game_map.is_walkable(x, 0) for x in range(3)] == [True, False, False]
+
+
+class TestNearestMineral:
+    """Tests for GameMap.get_nearest_mineral()."""
+
+    def test_skips_depleted_patches(self):
+        from simple.shared.map_loader import GameMap, MineralPatch
+        near = MineralPatch(2, 2, remaining=10)
+        far = MineralPatch(9, 9, remaining=10)
+        game_map = GameMap(width=12, height=12, tiles=[[0] * 12] * 12, minerals=[near, far])
+
+        assert game_map.get_nearest_mineral(0, 0) is near
+        near.harvest(10)
+        assert game_map.get_nearest_mineral(0, 0) is far
+        far.harvest(10)
+        assert game_map.get_nearest_mineral(0, 0) is None
+
+
+class TestMinerals:
+    """Tests for the team mineral helpers."""
+
+    def test_add_spend_get(self, simple_world):
+        start = simple_world.get_minerals(1)
+        simple_world.add_minerals(1, 25)
+        assert simple_world.spend_minerals(1, start + 25)
+        assert not simple_world.spend_minerals(1, 1)
+        assert simple_world.get_minerals(1) == 0
+
+    def test_unknown_team_has_none(self, simple_world):
+        assert simple_world.get_minerals(99) == 0
+        assert not simple_world.spend_minerals(99, 1)
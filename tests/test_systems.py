@@ -1,27 +1,25 @@
 """Test game systems."""
+import numpy as np
 import pytest
-from full.core.entities import Worker, Soldier, Base
+from full.core.entities import Worker, Soldier, Base, UNIT_STATS
+from full.core.world import FogOfWar
+from full.core.systems import (
+    MovementSystem, CombatSystem, ProductionSystem, FogOfWarSystem, ResourceSystem, AISystem
+)
 
 
 class TestMovementSystem:
     """Tests for MovementSystem."""
 
     def test_movement_system_creation(self, world):
-        from full.core.systems import MovementSystem
         ms = MovementSystem(world)
         assert ms.world is world
 
     def test_unit_moves_toward_destination(self, world):
-        from full.core.systems import MovementSystem
         ms = MovementSystem(world)
 
         # Find a worker and set destination
-        worker = None
-        for e in world.entities.values():
-            if isinstance(e, Worker):
-                worker = e
-                break
-
+        worker = world.first_of(Worker)
         if worker:
             start_x, start_y = worker.x, worker.y
             worker.destination = (start_x + 5, start_y)
@@ -33,8 +31,21 @@ class TestMovementSystem:
             # Worker should have moved toward destination
             assert worker.x != start_x or worker.destination is None
 
+    def test_path_step_is_speed_times_dt(self, world):
+        ms = MovementSystem(world)
+
+        workers = world.get_entities_by_type(Worker)[:2]
+        for worker in workers:
+            worker.path = [(int(worker.x) + 5, int(worker.y))]
+        starts = [(w.x, w.y) for w in workers]
+        ms.update(0.1)
+
+        for worker, (x, y) in zip(workers, starts):
+            if worker.path:  # Not blocked
+                assert (worker.x - x) ** 2 + (worker.y - y) ** 2 == pytest.approx((worker.speed * 0.1) ** 2)
+            assert world.game_map.is_walkable(int(worker.x), int(worker.y))
+
     def test_movement_respects_walls(self, world):
-        from full.core.systems import MovementSystem
         ms = MovementSystem(world)
 
         # Units shouldn't move into walls
@@ -48,22 +59,16 @@ class TestCombatSystem:
     """Tests for CombatSystem."""
 
     def test_combat_system_creation(self, world):
-        from full.core.systems import CombatSystem
         cs = CombatSystem(world)
         assert cs.world is world
 
     def test_soldier_attacks_enemy(self, world):
-        from full.core.systems import CombatSystem
         cs = CombatSystem(world)
 
         # Find a soldier and an enemy
-        soldier = None
-        enemy = None
-        for e in world.entities.values():
-            if isinstance(e, Soldier) and e.team == 1:
-                soldier = e
-            elif e.team == 2 and e.alive:
-                enemy = e
+        soldier = world.first_of(Soldier, team=1)
+        enemies = world.get_entities_by_team(2)
+        enemy = enemies[-1] if enemies else None
 
         if soldier and enemy:
             initial_hp = enemy.hp
@@ -84,62 +89,84 @@ class TestProductionSystem:
     """Tests for ProductionSystem."""
 
     def test_production_system_creation(self, world):
-        from full.core.systems import ProductionSystem
         ps = ProductionSystem(world)
         assert ps.world is world
 
     def test_production_spawns_unit(self, world):
-        from full.core.systems import ProductionSystem
         ps = ProductionSystem(world)
 
         # Find a base and queue production
-        base = None
-        for e in world.entities.values():
-            if isinstance(e, Base) and e.team == 1:
-                base = e
-                break
-
+        base = world.first_of(Base, team=1)
         if base:
             initial_count = len(world.entities)
             base.queue_production("Worker")
             world.team_minerals[1] = 1000  # Ensure enough minerals
 
-            # Run production for enough time
-            for _ in range(200):  # ~6 seconds at 30Hz
-                ps.update(0.033)
+            # Run production for enough time in one step
+            ps.update(10.0)
 
             # Should have spawned a new unit
             assert len(world.entities) > initial_count
 
+    def test_long_tick_finishes_several_units(self, world):
+        ps = ProductionSystem(world)
+        base = world.first_of(Base, team=1)
+        for _ in range(3):
+            base.queue_production("Worker")
+        world.team_minerals[1] = 1000
+        workers = len(world.get_entities_by_type(Worker))
+
+        # Two and a half build times: two workers done, the third under way
+        ps.update(base.build_time * 2.5)
+        assert len(world.get_entities_by_type(Worker)) == workers + 2
+        assert len(base.production_queue) == 1
+        assert base.production_progress == pytest.approx(0.5)
+
+    def test_finishing_tick_does_not_start_next_unit(self, world):
+        ps = ProductionSystem(world)
+        base = world.first_of(Base, team=1)
+        base.queue_production("Worker")
+        base.queue_production("Worker")
+        world.team_minerals[1] = 1000
+        workers = len(world.get_entities_by_type(Worker))
+
+        ticks = 0
+        while len(world.get_entities_by_type(Worker)) == workers:
+            ps.update(1.0 / 30)
+            ticks += 1
+
+        # Finished on time, and the second worker is only paid for next tick
+        assert ticks == round(base.build_time * 30)
+        assert world.team_minerals[1] == 1000 - UNIT_STATS["Worker"]["cost"]
+        assert base.production_progress == 0
+
 
 class TestFogOfWarSystem:
     """Tests for FogOfWarSystem."""
 
     def test_fog_system_creation(self, world):
-        from full.core.systems import FogOfWarSystem
         fow = FogOfWarSystem(world)
         assert fow.world is world
 
     def test_fog_reveals_around_units(self, world):
-        from full.core.systems import FogOfWarSystem
         fow = FogOfWarSystem(world)
 
         # Update fog
         fow.update(0.1)
 
         # Tiles around player units should be visible
-        for e in world.entities.values():
-            if e.team == 1 and e.alive:
-                fog = world.fog[1]
-                x, y = int(e.x), int(e.y)
-                assert fog.is_visible(x, y), f"Unit position ({x}, {y}) should be visible"
+        players = world.get_entities_by_team(1)
+        xs = np.fromiter((int(e.x) for e in players), dtype=np.int32, count=len(players))
+        ys = np.fromiter((int(e.y) for e in players), dtype=np.int32, count=len(players))
+        visible = world.fog[1].grid[ys, xs] == FogOfWar.VISIBLE
+        hidden = [(int(xs[i]), int(ys[i])) for i in np.flatnonzero(~visible)]
+        assert visible.all(), f"Unit positions {hidden} should be visible"
 
 
 class TestResourceSystem:
     """Tests for ResourceSystem."""
 
     def test_resource_system_creation(self, world):
-        from full.core.systems import ResourceSystem
         rs = ResourceSystem(world)
         assert rs.world is world
 
@@ -148,13 +175,11 @@ class TestAISystem:
     """Tests for AISystem."""
 
     def test_ai_system_creation(self, world):
-        from full.core.systems import AISystem
         ai = AISystem(world, team=2)
         assert ai.world is world
         assert ai.team == 2
 
     def test_ai_has_valid_state(self, world):
-        from full.core.systems import AISystem
         ai = AISystem(world, team=2)
         valid_states = ["opening", "economy", "military", "army", "attack"]
         assert ai.state in valid_states
@@ -1,4 +1,5 @@
 """Test World state management."""
+import numpy as np
 import pytest
 
 
@@ -26,18 +27,73 @@ class TestWorld:
 
     def test_world_get_entity(self, world):
         # Get first entity
-        entity_id = list(world.entities.keys())[0]
+        entity_id = next(iter(world.entities))
         entity = world.get_entity(entity_id)
         assert entity is not None
         assert entity.id == entity_id
 
     def test_world_get_entity_at(self, world):
         # Get first entity and check get_entity_at works
-        entity = list(world.entities.values())[0]
+        entity = next(iter(world.entities.values()))
         found = world.get_entity_at(entity.x, entity.y)
         assert found is not None
         assert found.id == entity.id
 
+    def test_world_get_entity_at_sees_spawns(self, world):
+        # A unit spawned after a query is found without advancing time
+        assert world.get_entity_at(0.5, 0.5) is None
+        worker = world.spawn_entity("Worker", 1, (0.5, 0.5))
+        assert world.get_entity_at(0.6, 0.5) is worker
+
+        # Only enemies within range, oldest first
+        enemy = world.spawn_entity("Soldier", 2, (3.0, 0.5))
+        world.spawn_entity("Soldier", 2, (9.0, 0.5))
+        assert world.get_enemies_in_range(worker, 3.0) == [enemy]
+
+    def test_world_get_entity_at_after_move(self, world):
+        worker = world.spawn_entity("Worker", 1, (0.5, 0.5))
+        assert world.get_entity_at(0.5, 0.5) is worker  # Builds the grid
+
+        # Moved by hand within the same tick
+        worker.x = 20.5
+        world.mark_moved()
+        assert world.get_entity_at(20.5, 0.5) is worker
+        assert world.get_entity_at(0.5, 0.5) is None
+
+    def test_world_get_buildings_tracks_spawns(self, world):
+        from full.core.entities import Building
+        before = world.get_buildings(1)
+        assert all(isinstance(b, Building) for b in before)
+
+        barracks = world.spawn_entity("Barracks", 1, (2.0, 2.0))
+        world.spawn_entity("Worker", 1, (3.0, 2.0))
+        assert world.get_buildings(1) == before + [barracks]
+        world.remove_entity(barracks.id)
+        assert world.get_buildings(1) == before
+
+    def test_world_type_index(self, world):
+        from full.core.entities import Base, Unit, Worker
+        assert world.first_of(Base, team=2).team == 2
+        assert world.first_of(Worker, team=99) is None
+
+        units = list(world.iter_type(Unit))
+        assert units == [e for e in world.entities.values() if isinstance(e, Unit)]
+
+        worker = world.first_of(Worker)
+        world.remove_entity(worker.id)
+        assert worker not in world.iter_type(Worker)
+        assert worker not in world.get_entities_by_team(worker.team)
+
+    def test_world_force_kill(self, world):
+        from full.core.entities import Base
+        base = world.first_of(Base, team=2)
+        world.force_kill(base.id)
+        assert base.hp == 0 and not base.alive
+        assert world.get_base(2) is None
+
+        world.check_victory()
+        assert world.winner == 1
+
     def test_world_minerals_tracking(self, world):
         # Initial minerals should be set
         team1_minerals = world.get_minerals(1)
@@ -56,18 +112,27 @@ class TestGameMap:
 
     def test_is_walkable(self, world):
         game_map = world.game_map
-        # Find a walkable and unwalkable tile
-        has_walkable = False
-        has_wall = False
-        for y in range(game_map.height):
-            for x in range(game_map.width):
-                if game_map.tiles[y][x] == 0:
-                    assert game_map.is_walkable(x, y)
-                    has_walkable = True
-                elif game_map.tiles[y][x] == 1:
-                    assert not game_map.is_walkable(x, y)
-                    has_wall = True
-        assert has_walkable, "Map should have walkable tiles"
+        # Find the walkable and unwalkable tiles
+        tiles = game_map.tiles
+        walk_ys, walk_xs = np.nonzero(tiles == 0)
+        wall_ys, wall_xs = np.nonzero(tiles == 1)
+        assert len(walk_xs) > 0, "Map should have walkable tiles"
+        for x, y in zip(walk_xs.tolist(), walk_ys.tolist()):
+            assert game_map.is_walkable(x, y)
+        for x, y in zip(wall_xs.tolist(), wall_ys.tolist()):
+            assert not game_map.is_walkable(x, y)
+
+    def test_tiles_from_lists(self):
+        from full.core.world import GameMap
+        game_map = GameMap(width=3, height=2, tiles=[[0, 1, 0], [0, 0, 1]])
+        assert game_map.tiles.dtype == np.int8 and game_map.tiles.shape == (2, 3)
+        assert game_map.is_walkable(2, 0) and not game_map.is_walkable(2, 1)
+
+    def test_maps_compare_by_tiles(self):
+        from full.core.world import GameMap
+        game_map = GameMap(width=2, height=1, tiles=[[0, 1]])
+        assert game_map == GameMap(width=2, height=1, tiles=[[0, 1]])
+        assert game_map != GameMap(width=2, height=1, tiles=[[1, 1]])
 
     def test_out_of_bounds_not_walkable(self, world):
         game_map = world.game_map
@@ -92,9 +157,22 @@ class TestFogData:
         w.load_scenario(data_dir / "scenario.json")
         fog = w.fog[1]
         # Most tiles should be unexplored before FOW update
-        unexplored_count = 0
-        for y in range(fog.height):
-            for x in range(fog.width):
-                if not fog.is_explored(x, y):
-                    unexplored_count += 1
+        unexplored_count = int((np.asarray(fog.grid) < fog.EXPLORED).sum())
         assert unexplored_count > 0, "Some tiles should be unexplored initially"
+
+    def test_fog_reveals_disc_once(self):
+        from types import SimpleNamespace
+        from full.core.world import FogOfWar
+        fog = FogOfWar(20, 20)
+        scout = SimpleNamespace(x=0.5, y=10.5, vision=2, alive=True)
+
+        revealed = fog.update_visibility([scout])
+        # Disc of radius 2 around (0, 10), clipped at the left map edge
+        assert revealed == {(x, y) for x in range(3) for y in range(8, 13)
+                            if x * x + (y - 10) ** 2 <= 4}
+        assert fog.update_visibility([scout]) == set()
+
+        scout.x = 15.0
+        fog.update_visibility([scout])
+        assert fog.is_explored(0, 10) and not fog.is_visible(0, 10)
+        assert fog.is_visible(15, 10)